@@ -6,6 +6,10 @@ from selenium.common.exceptions import TimeoutException
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from session import BrowserSession
+from place_cache import PLACE_CACHE, open_entry_cached
+from history import HistoryStore, now_str
+from http_fetch import make_fetcher, fetch_store
 
 # 문자열 안에서 숫자를 찾아 정수(int)로 변환 → 방문자 리뷰수, 블로그 리뷰수 처리 ex) 방문자 리뷰수 1,490 -> 1490
 def _int_from(text: str):
@@ -14,21 +18,21 @@ def _int_from(text: str):
 
 # iframe → entryIframe으로 진입  
 # 해당 함수가 없으면 가게 페이지 안에서 클릭이나 크롤링이 먹히지 않음 **꼭 필요**
-def _ensure_entry_iframe():
+def _ensure_entry_iframe(driver, wait):
     driver.switch_to.default_content()
     
     # 로딩 기다렸다가 바로 진입
     wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe"))) 
 
 # 가게명 추출
-def _robust_place_name():
+def _robust_place_name(driver, wait):
     # 자바스크립트 실행
     name = (driver.execute_script("""
-      # 메타태그를 찾기
-      # ex) <meta property="og:title" content="와우솥뚜껑삼겹살 : 네이버">
+      // 메타태그를 찾기
+      // ex) <meta property="og:title" content="와우솥뚜껑삼겹살 : 네이버">
       const og = document.querySelector('meta[property="og:title"]'); 
 
-      # 있으면 og.content 반환, 없으면 document.title 반환
+      // 있으면 og.content 반환, 없으면 document.title 반환
       return (og && og.content) ? og.content : document.title;
     """) or "").split(" :")[0].strip()
     if name:
@@ -53,7 +57,7 @@ def _robust_place_name():
     return ""
 
 
-def _open_entry_by_search(query_name: str):
+def _open_entry_by_search(driver, wait, query_name: str):
     # 네이버 지도 진입 & 검색
     driver.switch_to.default_content()
     driver.get(f"https://map.naver.com/p/search/{quote(query_name)}")
@@ -104,11 +108,11 @@ def _open_entry_by_search(query_name: str):
 
     driver.switch_to.default_content()
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe#entryIframe")))
-    _ensure_entry_iframe()
+    _ensure_entry_iframe(driver, wait)
 
-def _extract_home_basic():
+def _extract_home_basic(driver, wait):
     # 이름/리뷰수/주소 추출
-    name = _robust_place_name()
+    name = _robust_place_name(driver, wait)
 
     # 방문자/블로그 리뷰 수
     visitor = blog = None
@@ -175,12 +179,20 @@ def _extract_home_basic():
         "address": address
     }
 
-def crawl_home_basic_for_store(store_name: str):
-    # 가게명으로 검색해서(맨 위 결과 클릭)
-    _open_entry_by_search(store_name)
+# session: session.BrowserSession (여러 가게/수집기가 같은 브라우저를 공유)
+# fetcher: http_fetch.PlaceFetcher → 이전에 찾은 가게는 브라우저 없이 HTTP로 (실패하면 브라우저로)
+def crawl_home_basic_for_store(session, store_name: str, fetcher=None):
+    if fetcher is not None:
+        data = fetch_store(store_name, fetcher, session, menus=False)["home"]
+    else:
+        session.start()
+        driver, wait = session.driver, session.wait
+
+        # 가게명으로 검색해서(맨 위 결과 클릭), 이전에 찾은 가게면 상세페이지로 바로 이동
+        open_entry_cached(driver, wait, store_name, _open_entry_by_search)
 
-    # 기본정보 수집집
-    data = _extract_home_basic()
+        # 기본정보 수집집
+        data = _extract_home_basic(driver, wait)
     print(f"{data['name']} | 리뷰수:{data['total_reviews']} (방문자:{data['visitor_reviews']}, 블로그:{data['blog_reviews']}) | 주소:{data['address']}")
     return data
 
@@ -197,20 +209,30 @@ names = [
     "갈비둥지",
 ]
 
-rows = []
-for n in names:
-    try:
-        # 데이터 쌓기
-        rows.append(crawl_home_basic_for_store(n))
-        time.sleep(0.8) 
-    except Exception as e:
-        print("실패:", n, e)
-
-# 데이터 프라임 형식으로 변환
-df = pd.DataFrame(rows, columns=["name","total_reviews","visitor_reviews","blog_reviews","address"])
-
-# 데이터 저장 경로 설정
-out = Path(r"C:\Users\output") / f"competitors_home_basic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-out.parent.mkdir(parents=True, exist_ok=True) # 상위 폴더 있다면 넘어가고 없다면 다 만들기
-df.to_csv(out, index=False, encoding="utf-8-sig")
-print("저장:", out)
+if __name__ == "__main__":
+    rows = []
+    snapshot_at = now_str() # 이번 실행의 모든 가게를 같은 시각으로 기록
+    fetcher = make_fetcher() # requests가 없으면 None → 브라우저로만
+    with BrowserSession(lazy=True) as session, HistoryStore() as history:
+        for n in names:
+            failed = False
+            try:
+                # 데이터 쌓기
+                data = crawl_home_basic_for_store(session, n, fetcher)
+                rows.append(data)
+                history.add_home(n, data, snapshot_at) # 누적 기록 (가게별 최신값/변화량 조회용)
+                time.sleep(0.8) 
+            except Exception as e:
+                print("실패:", n, e)
+                PLACE_CACHE.invalidate(n)
+                failed = True
+            session.store_done(failed)
+
+    # 데이터 프라임 형식으로 변환
+    df = pd.DataFrame(rows, columns=["name","total_reviews","visitor_reviews","blog_reviews","address"])
+
+    # 데이터 저장 경로 설정
+    out = Path(r"C:\Users\output") / f"competitors_home_basic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    out.parent.mkdir(parents=True, exist_ok=True) # 상위 폴더 있다면 넘어가고 없다면 다 만들기
+    df.to_csv(out, index=False, encoding="utf-8-sig")
+    print("저장:", out)
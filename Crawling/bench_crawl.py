@@ -0,0 +1,79 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+
+import review_date_count as rdc
+from dedup import DigestSet
+from mock_map_server import start_server
+
+# 로컬 mock_map_server로 리뷰 수집 전체 과정(검색 → 상세 → 리뷰 탭 → 스크롤/펼쳐서 더보기)을 실행해서
+# 수집 방식별 소요 시간 / 초당 건수 비교 (네이버 접속 없음, 매번 같은 리뷰 수·응답 지연)
+# 결과가 REVIEWS건과 다르면 누락/중복이 있다는 뜻
+
+REVIEWS = 3000     # 가게당 리뷰 수 (1만~10만으로 올려서 장시간 동작 확인)
+LATENCY_MS = 50    # 요청마다 응답 지연
+FAIL_RATE = 0.0    # 리뷰 목록 요청 실패 비율 (0.05 등으로 재시도 동작 확인)
+REUSE_MORE = False # True: "펼쳐서 더보기"가 같은 요소로 남는 페이지 (버튼을 매 라운드 다시 누르는지 확인)
+STORE = "와우 솥뚜껑삼겹살"
+
+# 이름 → (collect_reviews_full 옵션, network_log)
+# baseline: 예전 수집 방식 (고정 딜레이, 블록마다 WebDriver 호출로 파싱/클릭, 고정 간격 스크롤)
+MODES = {
+    "baseline": (dict(dom_wait=False, scan_new_only=False, js_expand=False, adaptive_scroll=False,
+                      extract="webdriver"), False),
+    "default": (dict(), False),
+    "prune_dom": (dict(prune_dom=True), False),
+    "network": (dict(extract="network"), True),
+}
+
+# 파일 대신 건수만 세는 sink (CsvReviewSink와 같은 인터페이스)
+class CountingSink:
+    def __init__(self):
+        self.path, self.count = None, 0
+
+    def open(self, place_name, resume_path=None):
+        return DigestSet()
+
+    def __call__(self, row):
+        self.count += 1
+
+    def close(self):
+        pass
+
+# place_cache를 거치지 않고 검색으로 진입 (실제 캐시에 로컬 주소가 저장되지 않도록)
+def run_mode(base_url, name, opts, network_log):
+    driver = rdc.make_driver("headless", network_log=network_log)
+    wait = WebDriverWait(driver, 10)
+    sink = CountingSink()
+    try:
+        rdc.MAP_BASE = base_url
+        t0 = time.time()
+        rdc.open_entry_by_search(driver, wait, STORE)
+        rdc.collect_reviews_full(driver, wait, hard_max=REVIEWS + 10, sink=sink, **opts)
+        sec = time.time() - t0
+    finally:
+        driver.quit()
+    return {"mode": name, "rows": sink.count, "sec": sec}
+
+if __name__ == "__main__":
+    server, base_url = start_server(reviews=REVIEWS, latency_ms=LATENCY_MS, review_fail_rate=FAIL_RATE,
+                                    reuse_more_button=REUSE_MORE)
+    print(f"mock 서버: {base_url} (리뷰 {REVIEWS}건, 지연 {LATENCY_MS}ms)")
+    results = []
+    try:
+        for name, (opts, network_log) in MODES.items():
+            before = dict(server.stats)
+            try:
+                r = run_mode(base_url, name, opts, network_log)
+            except Exception as e:
+                print(f"{name}: 실패 → {e}")
+                continue
+            r["requests"] = server.stats["requests"] - before["requests"]
+            results.append(r)
+            print(f"{name}: {r['rows']}건 {r['sec']:.1f}초 ({r['rows'] / max(r['sec'], 1e-9):.1f}건/초), 요청 {r['requests']}회")
+    finally:
+        server.shutdown()
+
+    print(f"\n{'방식':<12}{'건수':>8}{'초':>9}{'건/초':>9}  확인")
+    for r in results:
+        ok = "OK" if r["rows"] == REVIEWS else f"누락/중복 {r['rows'] - REVIEWS:+d}"
+        print(f"{r['mode']:<12}{r['rows']:>8}{r['sec']:>9.1f}{r['rows'] / max(r['sec'], 1e-9):>9.1f}  {ok}")
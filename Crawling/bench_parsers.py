@@ -0,0 +1,122 @@
+import time
+from pathlib import Path
+from selenium.webdriver.support.ui import WebDriverWait
+
+import review_date_count as rdc
+import basic_info, menu
+
+# 저장해 둔 entryIframe / searchIframe HTML로 파서들을 오프라인 확인 + 속도 측정
+# 네이버 지도 접속 없이 로컬 headless 크롬에서 실제 수집 함수를 그대로 실행
+# 선택자/파서를 바꿨을 때 결과가 그대로인지, 초당 몇 블록을 처리하는지 비교용
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "html"
+REPEAT = 500 # 측정할 때 리뷰/메뉴 블록을 이 개수까지 복제
+ROUNDS = 3   # 함수마다 반복 측정 횟수
+
+# 저장된 스냅샷 기준 기대값 (블록 복제 전)
+EXPECTED_REVIEWS = [
+    ("2024-08-20", 2, "솥뚜껑에 구워주셔서 기름이 쫙 빠지고 김치랑 같이 먹으니 최고예요. 재방문 의사 있습니다!"),
+    ("2024-08-18", 1, "직원분들이 친절하고 고기 상태가 좋아요"),
+    ("2024-08-15", 5, ""),
+    (None, 3, "날짜가 잘못 찍힌 리뷰"),
+    (None, None, "방문정보가 없는 블록 (스킵 대상)"),
+]
+EXPECTED_HOME = {"name": "와우솥뚜껑삼겹살", "visitor_reviews": 1490, "blog_reviews": 312, "total_reviews": 1802}
+EXPECTED_MENUS = ["솥뚜껑 생삼겹살", "솥뚜껑 목살", "김치볶음밥", "된장찌개"]
+EXPECTED_SEARCH = 4
+
+# 블록을 n개까지 복제 (같은 부모 아래에 붙임)
+REPLICATE_JS = """
+const sel = arguments[0], n = arguments[1];
+const items = Array.from(document.querySelectorAll(sel));
+if (!items.length) return 0;
+const parent = items[0].parentNode;
+for (let i = items.length; i < n; i++) parent.appendChild(items[i % items.length].cloneNode(true));
+return document.querySelectorAll(sel).length;
+"""
+
+def load(driver, name):
+    driver.switch_to.default_content()
+    driver.get((FIXTURE_DIR / name).resolve().as_uri())
+
+# fn을 ROUNDS번 실행 → 초당 블록 수 출력, 마지막 결과 반환
+def bench(label, fn, n_blocks, results):
+    out = fn() # 워밍업 겸 결과 확인용
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        out = fn()
+    dt = (time.perf_counter() - t0) / ROUNDS
+    rate = n_blocks / dt if dt > 0 else float("inf")
+    results.append((label, n_blocks, dt, rate))
+    print(f"  {label:<32} {n_blocks:>6}블록  {dt * 1000:>9.1f} ms  {rate:>10.1f} blocks/s")
+    return out
+
+def check(label, ok):
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}")
+    return ok
+
+def _review_tuple(it):
+    return (it["visit_date"], it["visit_count"], it["review_text"])
+
+def run_checks(driver, wait):
+    print("\n결과 확인 (스냅샷 원본)")
+    ok = True
+
+    load(driver, "entry_reviews.html")
+    blocks = rdc.find_review_blocks(driver)
+    dom = [(*rdc.parse_visit_block(b), rdc.extract_review_text(b)) for b in blocks]
+    js = [_review_tuple(it) for it in rdc.read_review_blocks(driver)]
+    ok &= check("parse_visit_block + extract_review_text", dom == EXPECTED_REVIEWS)
+    ok &= check("read_review_blocks (JS) == DOM 파서", js == dom)
+    first = [_review_tuple(it) for it in rdc.read_review_blocks(driver, only_new=True)]
+    again = rdc.read_review_blocks(driver, only_new=True)
+    ok &= check("read_review_blocks(only_new) 재호출 시 방문정보 블록 제외",
+                first == dom and len(again) == sum(1 for d, c, _ in dom if d is None and c is None))
+
+    load(driver, "entry_home.html")
+    home = basic_info._extract_home_basic(driver, wait)
+    ok &= check("_extract_home_basic", all(home.get(k) == v for k, v in EXPECTED_HOME.items()) and bool(home["address"]))
+
+    load(driver, "entry_menu.html")
+    menus = menu.parse_menu_items(driver)
+    ok &= check("parse_menu_items", [m["menu_name"] for m in menus] == EXPECTED_MENUS
+                and menus[0]["signature"] and menus[0]["price"] == 16000)
+    ok &= check("parse_menu_items (JS) == DOM 파서", menus == menu._parse_menu_items_dom(driver))
+
+    load(driver, "search.html")
+    ok &= check("search_candidates", len(rdc.search_candidates(driver)) == EXPECTED_SEARCH)
+    return ok
+
+def run_bench(driver, wait):
+    print(f"\n처리 속도 (블록 {REPEAT}개로 복제, {ROUNDS}회 평균)")
+    results = []
+
+    load(driver, "entry_reviews.html")
+    n = driver.execute_script(REPLICATE_JS, "li.place_apply_pui, li.EjjAW", REPEAT)
+    blocks = bench("find_review_blocks", lambda: rdc.find_review_blocks(driver), n, results)
+    bench("parse_visit_block", lambda: [rdc.parse_visit_block(b) for b in blocks], n, results)
+    bench("extract_review_text", lambda: [rdc.extract_review_text(b) for b in blocks], n, results)
+    bench("read_review_blocks (JS 1회)", lambda: rdc.read_review_blocks(driver), n, results)
+
+    load(driver, "entry_menu.html")
+    n = driver.execute_script(REPLICATE_JS, "li.E2jtL", REPEAT)
+    bench("_parse_menu_items_dom", lambda: menu._parse_menu_items_dom(driver), n, results)
+    bench("parse_menu_items (JS 1회)", lambda: menu.parse_menu_items(driver), n, results)
+
+    load(driver, "entry_home.html")
+    bench("_extract_home_basic", lambda: basic_info._extract_home_basic(driver, wait), 1, results)
+
+    load(driver, "search.html")
+    n = driver.execute_script(REPLICATE_JS, "li.UEzoS", REPEAT)
+    bench("search_candidates", lambda: rdc.search_candidates(driver), n, results)
+    return results
+
+if __name__ == "__main__":
+    driver = rdc.make_driver("headless")
+    wait = WebDriverWait(driver, 3)
+    try:
+        ok = run_checks(driver, wait)
+        run_bench(driver, wait)
+    finally:
+        driver.quit()
+    print("\n모든 확인 통과" if ok else "\n확인 실패 항목 있음")
@@ -1,85 +1,132 @@
 from urllib.parse import quote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-import time, pandas as pd
+import time, queue, threading, pandas as pd
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from session import BrowserSession, DEFAULT_USER_DATA_DIR
 
-# '방학역 삼겹살' 검색 결과에서 이름만 중복 제거해 TOP8 추출 + CSV 저장
+# 검색 결과에서 이름만 중복 제거해 TOP N 추출 + CSV 저장
 # 경쟁가게 이름 추출하기
+# 검색어 여러 개(역/메뉴 조합 등)를 브라우저 여러 개로 동시에 처리 → 검색어 컬럼이 있는 표 하나로 저장
 
-QUERY = "방학역 삼겹살"
+QUERIES = ["방학역 삼겹살"]
+TOP_N = 8
+WORKERS = 2 # 동시에 띄울 브라우저 수
+
+# 현재 searchIframe에 보이는 상호명 (중복 제거, 등장 순서 보존) → 한 번의 스크립트 호출
+# 광고로 인해 같은 가게가 두 번 나오는 것을 방지
+# 폴백: /entry/place/가 포함된 링크(가게 상세페이지로 가는 링크) 내부의 <span> 텍스트
+TOP_NAMES_JS = """
+let els = Array.from(document.querySelectorAll("span.TYaxT"));
+if (!els.length) {
+  const r = document.evaluate("//a[contains(@href,'/entry/place/')]/span[normalize-space()]", document, null,
+                              XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (let i = 0; i < r.snapshotLength; i++) els.push(r.snapshotItem(i));
+}
+const seen = new Set(), names = [];
+for (const e of els) {
+  const n = (e.innerText || e.textContent || "").trim();
+  if (n && !seen.has(n)) { seen.add(n); names.push(n); }
+}
+return names;
+"""
+
+def top_names_in_view(driver):
+    return driver.execute_script(TOP_NAMES_JS) or []
 
 # 검색 페이지 열고 searchIframe 진입
 # 가게 이름만 크롤링 → 상세 페이지까지 갈 필요 없음
 # <iframe id="searchIframe">  ← 가게 목록 (리스트) 표시
 # <iframe id="entryIframe">   ← 가게 상세 페이지 표시
-driver.switch_to.default_content()
-driver.get(f"https://map.naver.com/p/search/{quote(QUERY)}") # 네이버 지도 사이트
-
-# 로딩될 때까지 기다리기 → 바로 전환
-# 가게 상세 페이지로 전환한다면
-# wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe")))
-wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#searchIframe")))
-print("@ searchIframe 진입")
-
-# 결과 끝까지 스크롤(더 로드될 게 없을 때까지)
-stable = 0 # 스크롤을 내려도 페이지 높이가 변하지 않는 횟수
-prev_h = 0 # 이전 높이값 저장용
-while stable < 3: # 3번 이전에 높이가 변하는 경우
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);") # 스크롤 아래까지 내리기
-    time.sleep(0.8)
-    # 전체 높이 측정
-    h = driver.execute_script("return document.body.scrollHeight;")
-    
-    # 더이상 스크롤 되지 않는다면
-    if h == prev_h: 
-        stable += 1 
-    # 스크롤 된다면
-    else: 
-        stable = 0
-
-    # 전체 높이 저장
-    prev_h = h
-print("@ 스크롤 완료")
-
-# 이름만 수집
-# 맨처음엔 HTML 요소(span)들을 찾기
-name_els = driver.find_elements(By.CSS_SELECTOR, "span.TYaxT")
-
-# 만약 위에서 찾지 못한다면 XPATH 경로로 찾기
-if not name_els:
-    # 폴백: /entry/place/가 포함된 링크(가게 상세페이지로 가는 링크), 그 내부의 <span>요소 중 텍스트 가져오기
-    name_els = driver.find_elements(By.XPATH, "//a[contains(@href,'/entry/place/')]/span[normalize-space()]") # normalize-space(): 텍스트
-
-# text 형식으로 바꾸고 None이면 "", 양쪽 공백제거(.strip())
-raw_names = [(e.text or "").strip() for e in name_els]
-raw_names = [n for n in raw_names if n]  # 빈 문자열("") 제거
-
-# 중복 제거(등장 순서 보존) 후 TOP8 
-# 광고로 인해 중복되는 것을 방지
-seen = set() # 중복 검사용
-names = [] 
-for n in raw_names:
-    # seen 안에 없는 이름이라면 (즉, 중복되지 않았다면)
-    if n not in seen: 
-        # seen에 저장
-        seen.add(n) 
-        names.append(n)
-    
-    # 최대 8개의 이름만 저장 (Top 8)
-    if len(names) >= 8:
-        break
-
-print("@ 추출된 상호명(Top 8, dedup):")
-for i, n in enumerate(names, 1):
-    print(f"{i}. {n}")
-
-# CSV 저장
-# 현재 작업 디렉토리에 "output"폴더 경로
-outdir = Path.cwd() / "output"
-outdir.mkdir(exist_ok=True) # 폴더 없다면 생성
-outpath = outdir / "competitors_top8_names.csv" # 이름 설정
-
-# 데이터프라임으로 변환 후 csv로 저장
-pd.DataFrame({"rank": range(1, len(names)+1), "name": names}).to_csv(outpath, index=False, encoding="utf-8-sig")
-print("@ 저장:", outpath)
+#
+# 이미 top_n개가 보이면 스크롤하지 않고 바로 반환
+# 부족할 때만 아래로 스크롤 → 높이가 늘어나는 즉시 다시 확인 (max_wait까지), 3번 연속 그대로면 종료
+def discover_competitors(driver, wait, query, top_n=TOP_N, max_wait=0.8, poll=0.1):
+    driver.switch_to.default_content()
+    driver.get(f"https://map.naver.com/p/search/{quote(query)}") # 네이버 지도 사이트
+    wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#searchIframe")))
+
+    names = top_names_in_view(driver)
+    stable = 0 # 스크롤을 내려도 페이지 높이가 변하지 않는 횟수
+    prev_h = driver.execute_script("return document.body.scrollHeight;")
+    while len(names) < top_n and stable < 3:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);") # 스크롤 아래까지 내리기
+        t0, h = time.time(), prev_h
+        while time.time() - t0 < max_wait:
+            time.sleep(poll)
+            h = driver.execute_script("return document.body.scrollHeight;")
+            if h != prev_h:
+                break
+        stable = stable + 1 if h == prev_h else 0
+        prev_h = h
+        names = top_names_in_view(driver)
+
+    return names[:top_n]
+
+# 워커 1개: 브라우저 1개로 큐에서 검색어를 하나씩 꺼내 처리
+# 크롬 프로필 폴더는 동시에 하나의 브라우저만 쓸 수 있으므로 워커마다 따로 둠
+def _discover_worker(worker_id, jobs, results, lock, top_n, profile, limiter):
+    with BrowserSession(profile, user_data_dir=f"{DEFAULT_USER_DATA_DIR}_w{worker_id}", limiter=limiter) as session:
+        while True:
+            try:
+                q = jobs.get_nowait()
+            except queue.Empty:
+                break
+            failed = False
+            try:
+                names = discover_competitors(session.driver, session.wait, q, top_n)
+                print(f"@ [{q}] {len(names)}곳")
+            except Exception as e:
+                print(f"@ [{q}] 실패: {e}")
+                names, failed = [], True
+            with lock:
+                results[q] = names
+            session.store_done(failed)
+
+# 검색어 여러 개 → [{query, rank, name, appearances}, ...]
+# appearances: 이 가게가 몇 개 검색어의 TOP N에 들었는지 (여러 검색어에 겹치는 가게 = 주요 경쟁가게)
+# limiter: ratelimit.RateLimiter (다른 수집기와 같이 돌릴 때 공유)
+def discover_many(queries, top_n=TOP_N, workers=WORKERS, profile="headless", limiter=None):
+    jobs = queue.Queue()
+    for q in queries:
+        jobs.put(q)
+
+    results, lock = {}, threading.Lock()
+    workers = max(1, min(workers, len(queries)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_discover_worker, i, jobs, results, lock, top_n, profile, limiter)
+                   for i in range(1, workers + 1)]
+        for f in futures:
+            f.result()
+
+    counts = {}
+    for names in results.values():
+        for n in names:
+            counts[n] = counts.get(n, 0) + 1
+
+    # 입력한 검색어 순서 → 순위 순
+    rows = []
+    for q in queries:
+        for rank, n in enumerate(results.get(q, []), 1):
+            rows.append({"query": q, "rank": rank, "name": n, "appearances": counts[n]})
+    return rows
+
+if __name__ == "__main__":
+    rows = discover_many(QUERIES, top_n=TOP_N, workers=WORKERS)
+
+    for q in QUERIES:
+        print(f"@ 추출된 상호명 [{q}] (Top {TOP_N}, dedup):")
+        for r in rows:
+            if r["query"] == q:
+                print(f"{r['rank']}. {r['name']}")
+
+    # CSV 저장
+    # 현재 작업 디렉토리에 "output"폴더 경로
+    outdir = Path.cwd() / "output"
+    outdir.mkdir(exist_ok=True) # 폴더 없다면 생성
+    outpath = outdir / f"competitors_top{TOP_N}_names.csv" # 이름 설정
+
+    # 데이터프라임으로 변환 후 csv로 저장
+    pd.DataFrame(rows, columns=["query", "rank", "name", "appearances"]).to_csv(outpath, index=False, encoding="utf-8-sig")
+    print("@ 저장:", outpath)
@@ -0,0 +1,101 @@
+import hashlib
+from array import array
+
+# 리뷰 중복 확인용 key 집합 (메모리 절약)
+# 기존에는 sha1 hex 문자열(40자, 객체당 약 90바이트)을 set에 보관 → 리뷰 수만 건이면 수 MB
+# 여기서는 64비트 정수 digest를 array('Q') 기반 해시 테이블에 저장 (key당 8바이트 / 채움률)
+# 이전에 저장된 hex key(상태 파일, 체크포인트)는 앞 16자리 = 같은 digest로 변환되므로 그대로 읽힘
+
+EMPTY = 0
+
+# 정규화된 key 문자열 → 64비트 정수 (sha1 앞 8바이트)
+def digest64(key_str):
+    return int.from_bytes(hashlib.sha1(key_str.encode("utf-8")).digest()[:8], "big")
+
+# 정수 또는 이전 형식의 sha1 hex 문자열 → 64비트 정수
+def as_digest(key):
+    if isinstance(key, int):
+        return key
+    return int(key[:16], 16)
+
+class DigestSet:
+    # capacity: 처음 테이블 크기 (2의 거듭제곱으로 맞춤), 채움률 0.6을 넘으면 2배로 확장
+    # bloom_bits: 0보다 크면 테이블 앞에 Bloom 필터를 둠 → 없는 key 확인 시 테이블 탐색 생략
+    def __init__(self, keys=(), capacity=1024, bloom_bits=0):
+        size = 16
+        while size < capacity:
+            size *= 2
+        self._table = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+        self._bloom = bytearray((bloom_bits + 7) // 8) if bloom_bits > 0 else None
+        self._bloom_bits = bloom_bits
+        for k in keys:
+            self.add(k)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return (d for d in self._table if d != EMPTY)
+
+    # 0은 빈 칸 표시로 쓰므로 digest 0은 1로 취급
+    @staticmethod
+    def _norm(key):
+        d = as_digest(key)
+        return d if d != EMPTY else 1
+
+    def _bloom_pos(self, d):
+        n = self._bloom_bits
+        return d % n, (d >> 32) % n
+
+    def _slot(self, d):
+        table, mask = self._table, self._mask
+        i = (d ^ (d >> 29)) & mask
+        while True:
+            v = table[i]
+            if v == EMPTY or v == d:
+                return i
+            i = (i + 1) & mask
+
+    def __contains__(self, key):
+        d = self._norm(key)
+        if self._bloom is not None:
+            for p in self._bloom_pos(d):
+                if not self._bloom[p >> 3] & (1 << (p & 7)):
+                    return False
+        return self._table[self._slot(d)] == d
+
+    def add(self, key):
+        d = self._norm(key)
+        i = self._slot(d)
+        if self._table[i] == d:
+            return
+        self._table[i] = d
+        self._len += 1
+        if self._bloom is not None:
+            for p in self._bloom_pos(d):
+                self._bloom[p >> 3] |= 1 << (p & 7)
+        if self._len > 0.6 * (self._mask + 1):
+            self._grow()
+
+    def update(self, keys):
+        for k in keys:
+            self.add(k)
+
+    def _grow(self):
+        old = self._table
+        self._table = array("Q", bytes(16 * (self._mask + 1)))
+        self._mask = len(self._table) - 1
+        for d in old:
+            if d != EMPTY:
+                self._table[self._slot(d)] = d
+
+    def __or__(self, other):
+        out = DigestSet(self, capacity=2 * (len(self) + len(other)))
+        out.update(other)
+        return out
+
+    # 메모리 사용량 (바이트)
+    def nbytes(self):
+        return self._table.itemsize * len(self._table) + (len(self._bloom) if self._bloom is not None else 0)
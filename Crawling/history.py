@@ -0,0 +1,176 @@
+import re, sqlite3
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+
+# 가게 기본정보 / 키워드 수치 누적 저장소 (SQLite, 추가만 함)
+# 실행마다 새 CSV를 만드는 대신 (가게, 수집시각) 단위로 한 테이블에 쌓아 두고
+# "가게별 최신값", "직전 수집 대비 변화량"을 CSV 전체를 다시 읽지 않고 바로 조회
+
+DEFAULT_DB_PATH = Path(r"C:\Users\output") / "store_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS home_snapshots (
+    store           TEXT NOT NULL,  -- 검색에 쓴 가게명 (names 목록의 값)
+    snapshot_at     TEXT NOT NULL,  -- 'YYYY-MM-DD HH:MM:SS'
+    name            TEXT,           -- 상세페이지의 상호명
+    total_reviews   INTEGER,
+    visitor_reviews INTEGER,
+    blog_reviews    INTEGER,
+    address         TEXT,
+    PRIMARY KEY (store, snapshot_at)
+);
+CREATE TABLE IF NOT EXISTS keyword_snapshots (
+    store       TEXT NOT NULL,
+    snapshot_at TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    count       INTEGER,
+    PRIMARY KEY (store, snapshot_at, label)
+);
+"""
+
+HOME_FIELDS = ["name", "total_reviews", "visitor_reviews", "blog_reviews", "address"]
+
+def now_str():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# 공백 차이 무시 ("와우 솥뚜껑삼겹살" == "와우솥뚜껑삼겹살")
+def _squash(s):
+    return re.sub(r"\s+", "", str(s or ""))
+
+class HistoryStore:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    # 같은 (가게, 시각)이 다시 들어오면 무시 → 재실행/백필해도 중복 없음
+    def add_home(self, store, data, snapshot_at=None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO home_snapshots VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (store, snapshot_at or now_str(), *[data.get(k) for k in HOME_FIELDS]))
+
+    # keywords: [(label, count), ...]
+    def add_keywords(self, store, keywords, snapshot_at=None):
+        ts = snapshot_at or now_str()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO keyword_snapshots VALUES (?, ?, ?, ?)",
+                [(store, ts, label, count) for label, count in keywords])
+
+    # 가게별 가장 최근 기본정보
+    def latest_home(self):
+        return pd.read_sql_query("""
+            SELECT h.* FROM home_snapshots h
+            JOIN (SELECT store, MAX(snapshot_at) AS ts FROM home_snapshots GROUP BY store) m
+              ON h.store = m.store AND h.snapshot_at = m.ts
+            ORDER BY h.store
+        """, self.conn)
+
+    # 가게별 최신 vs 직전 수집의 리뷰 수 변화
+    def home_delta(self):
+        return pd.read_sql_query("""
+            WITH ranked AS (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY store ORDER BY snapshot_at DESC) AS rn
+                FROM home_snapshots
+            )
+            SELECT cur.store, prev.snapshot_at AS prev_at, cur.snapshot_at AS cur_at,
+                   cur.visitor_reviews, cur.visitor_reviews - prev.visitor_reviews AS visitor_delta,
+                   cur.blog_reviews, cur.blog_reviews - prev.blog_reviews AS blog_delta,
+                   cur.total_reviews, cur.total_reviews - prev.total_reviews AS total_delta
+            FROM ranked cur LEFT JOIN ranked prev ON prev.store = cur.store AND prev.rn = 2
+            WHERE cur.rn = 1
+            ORDER BY cur.store
+        """, self.conn)
+
+    # 가게별 가장 최근 수집의 키워드 목록
+    def latest_keywords(self, store=None):
+        q = """
+            SELECT k.* FROM keyword_snapshots k
+            JOIN (SELECT store, MAX(snapshot_at) AS ts FROM keyword_snapshots GROUP BY store) m
+              ON k.store = m.store AND k.snapshot_at = m.ts
+        """
+        params = ()
+        if store is not None:
+            q += " WHERE k.store = ?"
+            params = (store,)
+        return pd.read_sql_query(q + " ORDER BY k.store, k.count DESC", self.conn, params=params)
+
+    # 키워드별 최신 vs 직전 수집의 선택 인원 변화 (새로 생긴 키워드는 prev_count가 비어 있음)
+    def keyword_delta(self, store=None):
+        q = """
+            WITH snaps AS (
+                SELECT store, snapshot_at,
+                       ROW_NUMBER() OVER (PARTITION BY store ORDER BY snapshot_at DESC) AS rn
+                FROM (SELECT DISTINCT store, snapshot_at FROM keyword_snapshots)
+            )
+            SELECT cur.store, cur.label, p.count AS prev_count, cur.count,
+                   cur.count - p.count AS delta
+            FROM keyword_snapshots cur
+            JOIN snaps s1 ON s1.store = cur.store AND s1.snapshot_at = cur.snapshot_at AND s1.rn = 1
+            LEFT JOIN snaps s2 ON s2.store = cur.store AND s2.rn = 2
+            LEFT JOIN keyword_snapshots p
+              ON p.store = cur.store AND p.snapshot_at = s2.snapshot_at AND p.label = cur.label
+        """
+        params = ()
+        if store is not None:
+            q += " WHERE cur.store = ?"
+            params = (store,)
+        return pd.read_sql_query(q + " ORDER BY cur.store, delta DESC", self.conn, params=params)
+
+    # 상호명 → store(검색 가게명) 대응표
+    # names(검색 가게명 목록)와 공백 무시로 같으면 그 이름, 아니면 이미 쌓인 기록의 (store, name) 쌍 사용
+    def store_lookup(self, names=()):
+        lookup = {_squash(q): q for q in names}
+        for store, name in self.conn.execute(
+                "SELECT DISTINCT store, name FROM home_snapshots WHERE name IS NOT NULL AND store != name"):
+            lookup.setdefault(_squash(name), store)
+        return lookup
+
+    # 기존 competitors_home_basic_<ts>.csv / competitors_keywords_<ts>.csv 를 한 번 옮겨 담기
+    # 파일명의 시각을 수집시각으로 사용
+    # 기존 CSV에는 검색 가게명이 없으므로 store_lookup으로 상호명 → 검색 가게명 변환 (실제 실행과 같은 store로 이어지도록)
+    # 대응하는 검색 가게명이 없으면 상호명을 store로
+    def import_csvs(self, folder, names=()):
+        lookup = self.store_lookup(names)
+        to_store = lambda name: lookup.get(_squash(name), name)
+        n = 0
+        for path in sorted(Path(folder).glob("competitors_*_*.csv")):
+            m = re.search(r'(\d{8})_(\d{6})', path.name)
+            if not m:
+                continue
+            ts = datetime.strptime(m.group(1) + m.group(2), "%Y%m%d%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+            df = pd.read_csv(path, encoding="utf-8-sig")
+            df = df.astype(object).where(df.notna(), None)
+            if path.name.startswith("competitors_home_basic_"):
+                for r in df.to_dict("records"):
+                    self.add_home(r.get("query") or to_store(r["name"]), r, ts)
+            elif path.name.startswith("competitors_keywords_"):
+                for place_name, g in df.groupby("place_name"):
+                    self.add_keywords(to_store(place_name), list(zip(g["label"], g["count"])), ts)
+            else:
+                continue
+            n += 1
+        return n
+
+if __name__ == "__main__":
+    import sys
+    with HistoryStore() as hs:
+        if len(sys.argv) > 1:
+            try:
+                from basic_info import names # 검색 가게명 목록 (실제 실행의 store 값)
+            except ImportError:
+                names = ()
+            print(f"가져온 파일 {hs.import_csvs(sys.argv[1], names)}개")
+        print(hs.home_delta().to_string(index=False))
@@ -0,0 +1,290 @@
+import re, threading
+from html.parser import HTMLParser
+
+try:
+    import requests # 없으면 HTTP 경로는 건너뛰고 항상 브라우저로 수집
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# 브라우저 없이 상세페이지 HTML을 바로 받아서 기본정보/메뉴 추출
+# 상세페이지(pcmap.place.naver.com)는 서버에서 HTML을 만들어 보내므로 홈/메뉴 정보는 요청 1번으로 읽힘
+# 결과 형식/규칙은 basic_info._extract_home_basic, menu.parse_menu_items 와 동일
+# 실패하거나 값이 비면 브라우저 수집(fetch_store의 session)으로 대체
+#
+# place_id는 place_cache에 저장된 값 사용 → 한 번도 브라우저로 찾은 적 없는 가게는 브라우저로 먼저 진입
+
+HOME_URL = "https://pcmap.place.naver.com/restaurant/{place_id}/home"
+MENU_URL = "https://pcmap.place.naver.com/restaurant/{place_id}/menu/list"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://map.naver.com/",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 블록 요소 → 텍스트 사이에 공백 (Selenium .text 와 비슷하게)
+BLOCK_TAGS = {"div", "p", "li", "ul", "section", "h1", "h2", "h3", "br", "tr", "td"}
+VOID_TAGS = {"meta", "link", "br", "img", "input", "hr", "source", "wbr"}
+
+# HTML → 간단한 트리 (표준 라이브러리만 사용)
+class Node:
+    def __init__(self, tag, attrs, parent=None):
+        self.tag, self.attrs, self.parent = tag, dict(attrs), parent
+        self.children = [] # Node 또는 str
+
+    def cls(self, name):
+        return name in (self.attrs.get("class") or "")
+
+    def iter(self):
+        for c in self.children:
+            if isinstance(c, Node):
+                yield c
+                yield from c.iter()
+
+    def find_all(self, pred):
+        return [n for n in self.iter() if pred(n)]
+
+    def find(self, pred):
+        return next((n for n in self.iter() if pred(n)), None)
+
+    def _texts(self, out):
+        for c in self.children:
+            if isinstance(c, Node):
+                if c.tag in ("script", "style"):
+                    continue
+                if c.tag in BLOCK_TAGS:
+                    out.append(" ")
+                c._texts(out)
+            else:
+                out.append(c)
+
+    @property
+    def text(self):
+        out = []
+        self._texts(out)
+        return re.sub(r"\s+", " ", "".join(out)).strip()
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = self.cur = Node("#root", [])
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self.cur)
+        self.cur.children.append(node)
+        if tag not in VOID_TAGS:
+            self.cur = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.cur.children.append(Node(tag, attrs, self.cur))
+
+    def handle_endtag(self, tag):
+        n = self.cur
+        while n is not None and n.tag != tag:
+            n = n.parent
+        if n is not None and n.parent is not None:
+            self.cur = n.parent
+
+    def handle_data(self, data):
+        self.cur.children.append(data)
+
+def parse_html(html):
+    b = _TreeBuilder()
+    b.feed(html)
+    b.close()
+    return b.root
+
+# basic_info._int_from 과 동일
+def _int_from(text):
+    m = re.search(r'(\d[\d,]*)', text or '')
+    return int(m.group(1).replace(',', '')) if m else None
+
+def _place_name(doc):
+    og = doc.find(lambda n: n.tag == "meta" and n.attrs.get("property") == "og:title")
+    title = doc.find(lambda n: n.tag == "title")
+    name = ((og.attrs.get("content") if og else "") or (title.text if title else "")).split(" :")[0].strip()
+    if name:
+        return name
+    el = doc.find(lambda n: n.tag == "span" and n.cls("Fc1rA") and n.text)
+    if el:
+        return el.text
+    el = doc.find(lambda n: n.tag == "span" and n.text and any(p.tag in ("h1", "h2") for p in _ancestors(n)))
+    return el.text if el else ""
+
+def _ancestors(n):
+    p = n.parent
+    while p is not None:
+        yield p
+        p = p.parent
+
+# 리뷰 수 버튼 (href 우선, 없으면 텍스트)
+def _review_count(doc, href_part, label):
+    el = doc.find(lambda n: n.tag == "a" and n.attrs.get("role") == "button" and href_part in (n.attrs.get("href") or ""))
+    if el is None:
+        el = doc.find(lambda n: n.tag in ("a", "span", "button") and label in n.text)
+    return _int_from(el.text) if el is not None else None
+
+def _address(doc):
+    el = doc.find(lambda n: n.tag == "span" and n.cls("LDgIH"))
+    if el is not None:
+        return el.text
+    for lab in doc.find_all(lambda n: n.tag == "span" and n.text == "주소"):
+        sibs = [c for c in lab.parent.children if isinstance(c, Node)]
+        i = sibs.index(lab)
+        if i + 1 < len(sibs) and sibs[i + 1].text:
+            return sibs[i + 1].text
+    return ""
+
+# 상세페이지 홈 HTML → _extract_home_basic 과 같은 dict
+def parse_home_html(html):
+    doc = parse_html(html)
+    visitor = _review_count(doc, "/review/visitor", "방문자 리뷰")
+    blog = _review_count(doc, "/review/ugc", "블로그 리뷰")
+    if visitor is not None and blog is not None:
+        total = visitor + blog
+    else:
+        total = visitor if visitor is not None else blog
+    return {
+        "name": _place_name(doc),
+        "visitor_reviews": visitor,
+        "blog_reviews": blog,
+        "total_reviews": total,
+        "address": re.sub(r"[ \t]+", " ", _address(doc)).strip(),
+    }
+
+# 메뉴 HTML → menu.parse_menu_items 와 같은 목록 (MENU_ITEM_XPATH 와 같은 범위)
+def parse_menu_html(html):
+    doc = parse_html(html)
+    items, seen = [], set()
+    for sec in doc.find_all(lambda n: n.tag == "section" and any(h.tag == "h2" and "메뉴" in h.text for h in n.iter())):
+        for li in sec.find_all(lambda n: n.tag == "li"):
+            if id(li) not in seen:
+                seen.add(id(li)); items.append(li)
+    for li in doc.find_all(lambda n: n.tag == "li" and n.cls("E2jtL")):
+        if id(li) not in seen:
+            seen.add(id(li)); items.append(li)
+    order = {id(n): i for i, n in enumerate(doc.iter())}
+    items.sort(key=lambda n: order[id(n)]) # XPath 합집합처럼 문서 순서
+
+    out = []
+    for li in items:
+        el = li.find(lambda n: n.tag == "span" and n.cls("lPzHi") and n.text) or \
+             li.find(lambda n: n.tag == "span" and n.text and any(p.tag == "div" and p.cls("yQlqY") for p in _ancestors(n)))
+        name = el.text if el else ""
+        em = li.find(lambda n: n.tag == "em")
+        price_text = em.text if em is not None and em.text else li.text
+        price = _int_from(price_text)
+        signature = any("대표" in n.text for n in li.find_all(lambda n: n.cls("place_blind")))
+        if name or price is not None:
+            out.append({"menu_name": name, "price_text": price_text, "price": price, "signature": signature})
+    return out
+
+class PlaceFetcher:
+    # home_url / menu_url: {place_id} 자리에 ID가 들어가는 주소 (로컬 테스트 서버로 바꿀 수 있음)
+    # pool: 호스트당 유지할 연결 수 (여러 스레드가 같은 fetcher 공유 가능)
+    def __init__(self, home_url=HOME_URL, menu_url=MENU_URL, timeout=5, pool=8):
+        if requests is None:
+            raise RuntimeError("requests 패키지가 없어 HTTP 수집을 사용할 수 없어요.")
+        self.home_url, self.menu_url, self.timeout = home_url, menu_url, timeout
+        self.http = requests.Session() # keep-alive 연결 재사용
+        adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool, max_retries=1)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.http.headers.update(HEADERS)
+        self.lock = threading.Lock()
+        self.ok = self.failed = 0
+
+    def close(self):
+        self.http.close()
+
+    def _get(self, url):
+        r = self.http.get(url, timeout=self.timeout)
+        r.raise_for_status()
+        if "charset" not in r.headers.get("Content-Type", "").lower():
+            r.encoding = "utf-8" # 헤더에 charset이 없으면 requests는 ISO-8859-1로 읽음
+        return r.text
+
+    def fetch_home(self, place_id):
+        return parse_home_html(self._get(self.home_url.format(place_id=place_id)))
+
+    def fetch_menus(self, place_id):
+        return parse_menu_html(self._get(self.menu_url.format(place_id=place_id)))
+
+    # 홈 + 메뉴, 이름이나 리뷰 수를 못 읽으면 실패로 보고 예외 (→ 브라우저로)
+    def fetch(self, place_id, menus=True):
+        home = self.fetch_home(place_id)
+        if not home["name"] or (home["visitor_reviews"] is None and home["blog_reviews"] is None):
+            raise ValueError(f"홈 정보 비어 있음 (place_id={place_id})")
+        return {"home": home, "menus": self.fetch_menus(place_id) if menus else None}
+
+# requests가 없으면 None → fetch_store는 항상 브라우저로
+def make_fetcher(**kwargs):
+    return PlaceFetcher(**kwargs) if requests is not None else None
+
+# 가게 1곳: 캐시에 place_id가 있으면 HTTP로, 안 되면 브라우저(session)로
+# 반환: {"home", "menus", "source": "http" | "browser"}
+# session이 아직 시작 전이면(BrowserSession(lazy=True)) 브라우저가 필요할 때 시작
+def fetch_store(store_name, fetcher=None, session=None, menus=True, cache=None):
+    from place_cache import PLACE_CACHE
+    cache = cache or PLACE_CACHE
+    ent = cache.get(store_name)
+    if fetcher is not None and ent:
+        try:
+            res = fetcher.fetch(ent["place_id"], menus)
+            with fetcher.lock:
+                fetcher.ok += 1
+            return {**res, "source": "http"}
+        except Exception as e:
+            with fetcher.lock:
+                fetcher.failed += 1
+            print(f"  HTTP 수집 실패 → 브라우저로: {store_name} ({e})")
+
+    if session is None:
+        raise RuntimeError(f"HTTP로 수집하지 못했고 브라우저 세션이 없어요: {store_name}")
+    from place_cache import open_entry_cached
+    from basic_info import _extract_home_basic
+    from menu import open_entry_by_search, collect_menus
+    session.start()
+    open_entry_cached(session.driver, session.wait, store_name, open_entry_by_search, cache)
+    home = _extract_home_basic(session.driver, session.wait)
+    return {"home": home, "menus": collect_menus(session.driver, session.wait, max_rounds=6) if menus else None,
+            "source": "browser"}
+
+# 저장해 둔 상세페이지 HTML(fixtures/html)을 로컬 서버로 띄워 HTTP 경로를 오프라인 확인
+# 기대값은 bench_parsers 와 같음 (브라우저 파서와 결과가 같아야 함)
+def run_offline_check():
+    import functools
+    from pathlib import Path
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    root = Path(__file__).parent / "fixtures" / "html"
+    handler = functools.partial(QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        f = PlaceFetcher(home_url=base + "/entry_home.html?id={place_id}",
+                         menu_url=base + "/entry_menu.html?id={place_id}")
+        res = f.fetch("1234567890")
+        f.close()
+    finally:
+        server.shutdown()
+
+    home, menus = res["home"], res["menus"]
+    ok = home == {"name": "와우솥뚜껑삼겹살", "visitor_reviews": 1490, "blog_reviews": 312,
+                  "total_reviews": 1802, "address": "서울 도봉구 도당로13길 12 1층"}
+    ok &= [m["menu_name"] for m in menus] == ["솥뚜껑 생삼겹살", "솥뚜껑 목살", "김치볶음밥", "된장찌개"]
+    ok &= menus[0]["signature"] and menus[0]["price"] == 16000 and menus[3]["price"] is None
+    print(home)
+    for m in menus:
+        print(m)
+    print("확인 통과" if ok else "확인 실패")
+    return ok
+
+if __name__ == "__main__":
+    run_offline_check()
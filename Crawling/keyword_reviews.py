@@ -1,6 +1,12 @@
+import re, time
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
+from selenium.webdriver.common.by import By
+from menu import ensure_entry_iframe, open_entry_by_search
+from session import BrowserSession
+from place_cache import PLACE_CACHE, open_entry_cached
+from history import HistoryStore, now_str
 
 names = [
     "돈미화로 방학동점",
@@ -13,42 +19,107 @@ names = [
     "갈비둥지",
 ]
 
+# 문자열 안의 첫 번째 숫자 → 정수 ex) 이 키워드를 선택한 인원 1,234 → 1234
+def int_from(text: str):
+    m = re.search(r'(\d[\d,]*)', text or '')
+    return int(m.group(1).replace(',', '')) if m else None
 
 # 가게명 (있는 경우 그대로, 없으면 og:title로)
-place_name = (driver.execute_script("""
-  const og = document.querySelector('meta[property="og:title"]');
-  return (og && og.content) ? og.content : document.title;
-""") or "").split(" :")[0].strip()
+def place_title(driver):
+    return (driver.execute_script("""
+      const og = document.querySelector('meta[property="og:title"]');
+      return (og && og.content) ? og.content : document.title;
+    """) or "").split(" :")[0].strip()
 
-df_kw = pd.DataFrame(keywords, columns=["label", "count"])
-df_kw.insert(0, "place_name", place_name)
+# 키워드 목록의 "더보기" 클릭 (펼쳐서 더보기 제외)
+def click_more_generic(driver, max_clicks=5, sleep=0.5):
+    clicked = 0
+    for _ in range(max_clicks):
+        btns = driver.find_elements(
+            By.XPATH,
+            "//a[contains(.,'더보기') and not(contains(.,'펼쳐서'))]"
+            " | //button[contains(.,'더보기') and not(contains(.,'펼쳐서'))]"
+        )
+        btns = [b for b in btns if b.is_displayed()]
+        if not btns:
+            break
+        driver.execute_script("arguments[0].click();", btns[0]); time.sleep(sleep)
+        clicked += 1
+    return clicked
 
-outdir = Path(r"C:\Users\output"); outdir.mkdir(parents=True, exist_ok=True)
-outpath = outdir / f"{place_name}_keywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-df_kw.to_csv(outpath, index=False, encoding="utf-8-sig")
-print("저장:", outpath)
-df_kw.head()
+# 한 가게의 키워드만 따로 저장
+def save_place_keywords(place_name, keywords):
+    df_kw = pd.DataFrame(keywords, columns=["label", "count"])
+    df_kw.insert(0, "place_name", place_name)
 
+    outdir = Path(r"C:\Users\output"); outdir.mkdir(parents=True, exist_ok=True)
+    outpath = outdir / f"{place_name}_keywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    df_kw.to_csv(outpath, index=False, encoding="utf-8-sig")
+    print("저장:", outpath)
+    return outpath
 
-def collect_keywords_current_page():
+
+def collect_keywords_current_page(driver, wait):
     # 리뷰 탭 → 더보기 → 추출
     # entryIframe로 전환
-    ensure_entry_iframe()
-  
+    ensure_entry_iframe(driver, wait)
+
     # 리뷰 탭
     for xp in ["//a[@role='tab' and contains(.,'리뷰')]", "//button[contains(.,'리뷰')]"]:
         els = driver.find_elements(By.XPATH, xp)
         if els:
             driver.execute_script("arguments[0].click();", els[0]); time.sleep(0.5); break
-          
+
     # 더보기 클릭
-    click_more_generic(max_clicks=5, sleep=0.5)
-  
+    click_more_generic(driver, max_clicks=5, sleep=0.5)
+
     # 수집
-    kw_items = driver.find_elements(By.XPATH,"//li[.//span[contains(@class,'t3JSf')] and .//span[contains(@class,'CUoLy')]]") \
-               or driver.find_elements(By.XPATH,"//li[.//span[contains(.,'키워드를 선택한 인원')]]")
+    return parse_keyword_items(driver)
+
+KEYWORD_ITEM_XPATHS = [
+    "//li[.//span[contains(@class,'t3JSf')] and .//span[contains(@class,'CUoLy')]]",
+    "//li[.//span[contains(.,'키워드를 선택한 인원')]]",
+]
+
+# 키워드 <li> 전체를 한 번의 스크립트 호출로 읽기 → [{label, text}, ...]
+# label은 _parse_keyword_items_dom 과 같은 규칙, 숫자는 파이썬 int_from으로
+EXTRACT_KEYWORDS_JS = """
+const txt = el => el ? (el.innerText || el.textContent || "").trim() : "";
+let items = [];
+for (const xp of arguments[0]) {
+  const r = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (let i = 0; i < r.snapshotLength; i++) items.push(r.snapshotItem(i));
+  if (items.length) break;
+}
+return items.map(li => {
+  let label = "";
+  const el = li.querySelector("span[class*='t3JSf']");
+  if (el && txt(el)) {
+    label = txt(el);
+  } else {
+    const spans = Array.from(li.querySelectorAll("span")).map(txt).filter(Boolean);
+    if (spans.length) label = spans.find(s => !s.includes("키워드")) || spans[0];
+  }
+  return {label: label.replace(/"/g, ""), text: txt(li)};
+});
+"""
+
+# 현재 페이지의 키워드 (label, count) 목록
+# 스크립트 실행이 실패하면 요소별로 읽는 기존 방식으로
+def parse_keyword_items(driver):
+    try:
+        raw = driver.execute_script(EXTRACT_KEYWORDS_JS, KEYWORD_ITEM_XPATHS)
+    except Exception:
+        raw = None
+    if raw is None:
+        return _parse_keyword_items_dom(driver)
+    return [(it["label"], int_from(it["text"])) for it in raw if it["label"]]
+
+def _parse_keyword_items_dom(driver):
+    kw_items = driver.find_elements(By.XPATH, KEYWORD_ITEM_XPATHS[0]) \
+               or driver.find_elements(By.XPATH, KEYWORD_ITEM_XPATHS[1])
     out = []
-  
+
     for li in kw_items:
         # 라벨
         label = ""
@@ -65,30 +136,39 @@ def collect_keywords_current_page():
             out.append((label, cnt))
     return out
 
-rows = []
-for name in names:
-    try:
-        # searchIframe에서 상호 클릭하여 entryIframe 진입
-        open_entry_by_search(name)  
-
-        # 가게 이름 추출
-        place_name = (driver.execute_script("""
-          const og = document.querySelector('meta[property="og:title"]');
-          return (og && og.content) ? og.content : document.title;
-        """) or "").split(" :")[0].strip()
-      
-        kws = collect_keywords_current_page()
-        for label, count in kws:
-            rows.append({"place_name": place_name or name, "label": label, "count": count})
-          
-        print(f"{name}: {len(kws)}개")
-        time.sleep(0.8)
-      
-    except Exception as e:
-        print(f"{name}: {e}")
-
-df_all = pd.DataFrame(rows)
-outdir = Path(r"C:\Users\output"); outdir.mkdir(parents=True, exist_ok=True)
-outpath = outdir / f"competitors_keywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-df_all.to_csv(outpath, index=False, encoding="utf-8-sig")
-print("저장:", outpath)
+# session: session.BrowserSession (여러 가게/수집기가 같은 브라우저를 공유)
+def crawl_keywords_for_store(session, name):
+    driver, wait = session.driver, session.wait
+
+    # searchIframe에서 상호 클릭하여 entryIframe 진입 (캐시에 있으면 상세페이지로 바로 이동)
+    open_entry_cached(driver, wait, name, open_entry_by_search)
+
+    # 가게 이름 추출
+    place_name = place_title(driver)
+
+    kws = collect_keywords_current_page(driver, wait)
+    print(f"{name}: {len(kws)}개")
+    return [{"place_name": place_name or name, "label": label, "count": count} for label, count in kws]
+
+if __name__ == "__main__":
+    rows = []
+    snapshot_at = now_str()
+    with BrowserSession() as session, HistoryStore() as history:
+        for name in names:
+            failed = False
+            try:
+                kw_rows = crawl_keywords_for_store(session, name)
+                rows.extend(kw_rows)
+                history.add_keywords(name, [(r["label"], r["count"]) for r in kw_rows], snapshot_at) # 누적 기록
+                time.sleep(0.8)
+            except Exception as e:
+                print(f"{name}: {e}")
+                PLACE_CACHE.invalidate(name)
+                failed = True
+            session.store_done(failed)
+
+    df_all = pd.DataFrame(rows)
+    outdir = Path(r"C:\Users\output"); outdir.mkdir(parents=True, exist_ok=True)
+    outpath = outdir / f"competitors_keywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    df_all.to_csv(outpath, index=False, encoding="utf-8-sig")
+    print("저장:", outpath)
@@ -5,6 +5,9 @@ from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from session import BrowserSession
+from place_cache import PLACE_CACHE, open_entry_cached
+from http_fetch import make_fetcher, fetch_store
 
 BASE_DIR = Path(r"C:\Users\output")  # 저장 폴더
 BASE_DIR.mkdir(parents=True, exist_ok=True) # 상위 폴더 있으면 Go 없으면 만들기
@@ -37,12 +40,12 @@ def slugify(s: str) -> str:
     return s or "place" 
 
 # 검색페이지 열고 entryIframe으로 전환
-def ensure_entry_iframe():
+def ensure_entry_iframe(driver, wait):
     driver.switch_to.default_content()
     wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe")))
 
 
-def open_entry_by_search(query_name: str):
+def open_entry_by_search(driver, wait, query_name: str):
     # 검색 결과에서 상호 클릭 → entryIframe 진입
     driver.switch_to.default_content()
     driver.get(f"https://map.naver.com/p/search/{quote(query_name)}")
@@ -99,9 +102,9 @@ def open_entry_by_search(query_name: str):
     time.sleep(0.8)
 
     # entryIframe으로 전환
-    ensure_entry_iframe()
+    ensure_entry_iframe(driver, wait)
 
-def open_menu_tab():
+def open_menu_tab(driver, wait):
     # 메뉴 탭 클릭(있으면 True)
     # 텍스트로 찾기
     for xp in ["//a[@role='tab' and contains(.,'메뉴')]", "//button[contains(.,'메뉴')]"]:
@@ -114,16 +117,19 @@ def open_menu_tab():
             continue
     return False
   
+# 메뉴 항목 <li>
+MENU_ITEM_XPATH = "//section[.//h2[contains(.,'메뉴')]]//li | //li[contains(@class,'E2jtL')]"
+
 # 메뉴 수집
-def collect_menus(max_rounds=5):
-    ensure_entry_iframe() # entryIframe으로 전환
-    open_menu_tab() # 메뉴 탭 클릭
+def collect_menus(driver, wait, max_rounds=5):
+    ensure_entry_iframe(driver, wait) # entryIframe으로 전환
+    open_menu_tab(driver, wait) # 메뉴 탭 클릭
 
     # 로딩 유도
     for _ in range(3):
         driver.execute_script("window.scrollBy(0, 700);"); time.sleep(0.2) # 화면을 내리기 (로딩)
 
-    item_xpath = "//section[.//h2[contains(.,'메뉴')]]//li | //li[contains(@class,'E2jtL')]"
+    item_xpath = MENU_ITEM_XPATH
 
     # '더보기' 여러 번
     prev = len(driver.find_elements(By.XPATH, item_xpath)) # 현재 로딩된 <li> 개수 저장
@@ -158,8 +164,56 @@ def collect_menus(max_rounds=5):
             break
         prev = cur
 
-    # 파싱
-    items = driver.find_elements(By.XPATH, item_xpath)
+    return parse_menu_items(driver)
+
+# 메뉴 <li> 전체를 한 번의 스크립트 호출로 읽기 (_parse_menu_items_dom 과 같은 선택자/폴백)
+# 가격 숫자 변환은 파이썬에서 (기존과 같은 정규식)
+EXTRACT_MENUS_JS = """
+const xp = arguments[0];
+const txt = el => el ? (el.innerText || el.textContent || "").trim() : "";
+const r = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < r.snapshotLength; i++) {
+  const li = r.snapshotItem(i);
+  let name = "";
+  for (const sel of ["span[class*='lPzHi']", "div[class*='yQlqY'] span"]) {
+    const el = Array.from(li.querySelectorAll(sel)).find(e => txt(e));
+    if (el) { name = txt(el); break; }
+  }
+  const em = li.querySelector("em");
+  const price_text = (em && txt(em)) ? txt(em) : txt(li);
+  const signature = Array.from(li.querySelectorAll("[class*='place_blind']")).some(e => e.textContent.includes("대표"));
+  out.push({name, price_text, signature});
+}
+return out;
+"""
+
+# 현재 메뉴 탭에 로딩된 <li> 파싱 (클릭/스크롤 없음 → 저장된 HTML로도 확인 가능)
+# 스크립트 실행이 실패하면 요소별로 읽는 기존 방식으로
+def parse_menu_items(driver):
+    try:
+        raw = driver.execute_script(EXTRACT_MENUS_JS, MENU_ITEM_XPATH)
+    except Exception:
+        raw = None
+    if raw is None:
+        return _parse_menu_items_dom(driver)
+
+    out = []
+    for it in raw:
+        name, price_text = it["name"], it["price_text"]
+        m = re.search(r'(\d[\d,]*)', price_text or '')
+        price = int(m.group(1).replace(',', '')) if m else None
+        if name or price is not None:
+            out.append({
+                "menu_name": name,
+                "price_text": price_text,
+                "price": price,
+                "signature": bool(it["signature"])
+            })
+    return out
+
+def _parse_menu_items_dom(driver):
+    items = driver.find_elements(By.XPATH, MENU_ITEM_XPATH)
     out = []
     for li in items:
         name = ""
@@ -192,11 +246,18 @@ def collect_menus(max_rounds=5):
     return out
 
 # 가게명으로 검색→상세 진입→메뉴만 수집→CSV 저장
-def crawl_menus_for_store(store_name: str):
-    # 가게 검색 후 상세페이지 열기
-    open_entry_by_search(store_name)
-    # 메뉴 수집 (최대 스크롤 6번)
-    menus = collect_menus(max_rounds=6)
+# session: session.BrowserSession (여러 가게/수집기가 같은 브라우저를 공유)
+# fetcher: http_fetch.PlaceFetcher → 이전에 찾은 가게는 브라우저 없이 HTTP로 (실패하면 브라우저로)
+def crawl_menus_for_store(session, store_name: str, fetcher=None):
+    if fetcher is not None:
+        menus = fetch_store(store_name, fetcher, session, menus=True)["menus"]
+    else:
+        session.start()
+        driver, wait = session.driver, session.wait
+        # 가게 검색 후 상세페이지 열기 (캐시에 있으면 검색 생략)
+        open_entry_cached(driver, wait, store_name, open_entry_by_search)
+        # 메뉴 수집 (최대 스크롤 6번)
+        menus = collect_menus(driver, wait, max_rounds=6)
 
     # 파일 저장
     slug = slugify(store_name)
@@ -211,9 +272,16 @@ def crawl_menus_for_store(store_name: str):
         print(f"{i}. {m['menu_name']} | {m['price_text']} | 대표:{'Y' if m['signature'] else ''}")
     return menus
 
-for n in names:
-    try:
-        crawl_menus_for_store(n)
-        time.sleep(0.8)  # 너무 빠르면 실패하니 숨고르기
-    except Exception as e:
-        print("실패:", n, e)
+if __name__ == "__main__":
+    fetcher = make_fetcher() # requests가 없으면 None → 브라우저로만
+    with BrowserSession(lazy=True) as session:
+        for n in names:
+            failed = False
+            try:
+                crawl_menus_for_store(session, n, fetcher)
+                time.sleep(0.8)  # 너무 빠르면 실패하니 숨고르기
+            except Exception as e:
+                print("실패:", n, e)
+                PLACE_CACHE.invalidate(n)
+                failed = True
+            session.store_done(failed)
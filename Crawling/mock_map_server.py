@@ -0,0 +1,294 @@
+import re, json, time, random, zlib, threading
+from datetime import date, timedelta
+from html import escape
+from urllib.parse import urlparse, parse_qs, unquote, quote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 로컬 네이버 지도 흉내 서버 (부하 테스트용)
+# 실제 사이트 대신 이 서버로 open_entry_by_search / collect_reviews_full 전체 과정을 돌려서
+# 리뷰 1만~10만 건 가게의 수집 시간, 수집 방식(dom_wait / prune_dom / network ...) 별 차이를 같은 조건으로 비교
+#
+# /p/search/<검색어>          상위 페이지 + iframe#searchIframe (상호 클릭 → iframe#entryIframe 추가, 주소 .../place/<id>)
+# /p/entry/place/<id>         상위 페이지 + iframe#entryIframe (place_cache의 바로 이동 주소)
+# /search_list?q=             검색 결과 목록 (li.UEzoS, a.place_bluelink, span.TYaxT)
+# /restaurant/<id>/home       상세페이지 (홈/메뉴/리뷰 탭, 키워드, 정렬, 리뷰 목록 + 펼쳐서 더보기)
+# /graphql?place=&offset=     리뷰 목록 응답 (network_reviews.parse_review_payload 가 읽는 형식)
+#
+# 리뷰 목록은 화면 맨 아래 근처까지 스크롤하거나 "펼쳐서 더보기"를 누를 때마다 page_size개씩 추가
+
+DEFAULTS = dict(
+    reviews=10000,         # 가게당 방문자 리뷰 수
+    page_size=10,          # 한 번에 추가되는 리뷰 수 (실제 사이트와 같게 10)
+    stores=10,             # 검색 결과 가게 수
+    latency_ms=50,         # 응답 지연 (모든 요청)
+    jitter_ms=20,          # 지연 랜덤 폭 (±)
+    review_fail_rate=0.0,  # 리뷰 목록 요청 실패(500) 비율 → 화면은 다음 스크롤 때 다시 요청
+    page_fail_rate=0.0,    # 상세/검색 페이지 실패(500) 비율 → 크롤러의 재시도/실패 처리 확인용
+    reuse_more_button=False, # True: "펼쳐서 더보기"를 한 번만 만들고 같은 요소를 계속 사용 (버튼을 다시 누르는지 확인)
+    seed=0,
+)
+
+WEEKDAYS = "월화수목금토일"
+PHRASES = ["고기가 두툼하고 맛있어요", "직원분들이 친절해요", "재방문 의사 있습니다", "김치가 맛있어요",
+           "가성비가 좋아요", "주차가 편해요", "매장이 깔끔해요", "양이 많아요"]
+NEIGHBORS = ["돈미화로 방학동점", "목구멍 방학점", "고기굽는베베", "방학동고추장삼겹살",
+             "싹쓰리솥뚜껑김치삼겹살 방학점", "싸전갈비", "갈비둥지", "와우솥뚜껑삼겹살", "삼겹살연구소", "한돈마을"]
+
+def place_id_of(name):
+    return 1000000000 + zlib.crc32(name.encode("utf-8")) % 900000000
+
+# i번째 리뷰 (0 = 최신), 같은 가게/번호면 항상 같은 내용 → 실행 간 비교 가능
+def make_review(place_id, i, today):
+    rnd = random.Random(place_id * 1000003 + i)
+    d = today - timedelta(days=i // 20)
+    text = f"{rnd.choice(PHRASES)}. {rnd.choice(PHRASES)} (리뷰 {i + 1})"
+    return {
+        "id": f"{place_id}-{i}",
+        "body": text,
+        "visitCount": rnd.randint(1, 5),
+        "visited": f"{d.month}.{d.day}.{WEEKDAYS[d.weekday()]}",
+        "representativeVisitDateTime": d.strftime("%Y-%m-%dT00:00:00"),
+    }
+
+TOP_PAGE = """<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{title} : 네이버 지도</title>
+<style>body{{margin:0;display:flex}} iframe{{border:0;height:95vh}} #searchIframe{{width:380px}} #entryIframe{{width:420px}}</style>
+</head><body>{frames}
+<script>
+function openEntry(id) {{
+  let f = document.getElementById("entryIframe");
+  if (!f) {{ f = document.createElement("iframe"); f.id = "entryIframe"; document.body.appendChild(f); }}
+  f.src = "/restaurant/" + id + "/home";
+  history.pushState(null, "", location.pathname.replace(/\\/place\\/\\d+$/, "") + "/place/" + id);
+}}
+</script></body></html>"""
+
+SEARCH_LIST = """<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{q}</title></head><body>
+<div id="_pcmap_list_scroll_container"><ul>{items}</ul></div></body></html>"""
+
+SEARCH_ITEM = """<li class="UEzoS" style="height:110px"><div class="CHC5F">
+<a role="button" class="place_bluelink tzwk0" href="#" onclick="parent.openEntry({pid});return false;"><span class="TYaxT">{name}</span><span class="KCMnt">돼지고기구이</span></a>
+</div></li>"""
+
+ENTRY_PAGE = """<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">
+<meta property="og:title" content="{name} : 네이버"><title>{name} : 네이버</title>
+<style>.tab-panel{{display:none}} .tab-panel.on{{display:block}} li.EjjAW{{min-height:140px;padding:8px 0;border-bottom:1px solid #eee}}</style>
+</head><body>
+<div class="zD5Nm">
+  <div class="LylZZ"><span class="Fc1rA">{name}</span><span class="lnJFt">돼지고기구이</span></div>
+  <div class="dAsGb">
+    <span class="PXMot"><a role="button" href="/restaurant/{pid}/review/visitor">방문자 리뷰 {total:,}</a></span>
+    <span class="PXMot"><a role="button" href="/restaurant/{pid}/review/ugc">블로그 리뷰 {blog:,}</a></span>
+  </div>
+</div>
+<div class="flicking-camera">
+  <a role="tab" href="#" data-tab="home">홈</a>
+  <a role="tab" href="#" data-tab="menu">메뉴</a>
+  <a role="tab" href="#" data-tab="review">리뷰</a>
+</div>
+<div class="tab-panel on" id="tab-home"><div class="place_section_content"><div class="O8qbU tQY7D">
+  <strong class="RmSbV"><span class="place_blind">주소</span></strong>
+  <div class="vV_z_"><span class="LDgIH">서울 도봉구 도당로{road}길 {no}  1층</span></div>
+</div></div></div>
+<div class="tab-panel" id="tab-menu"><section class="place_section"><h2 class="place_section_header">메뉴</h2><ul>{menus}</ul></section></div>
+<div class="tab-panel" id="tab-review">
+  <ul class="keywords">{keywords}</ul>
+  <button type="button" id="sortBtn">정렬</button><ul id="sortMenu" style="display:none"><li>최신순</li><li>추천순</li></ul>
+  <div class="place_section"><ul id="_review_list"></ul><div id="moreBox"></div></div>
+</div>
+<script>
+const PLACE = {pid}, TOTAL = {total}, PAGE = {page_size}, REUSE_MORE = {reuse_more};
+const list = document.getElementById("_review_list"), moreBox = document.getElementById("moreBox");
+let loaded = 0, loading = false, reviewTab = false;
+const esc = s => s.replace(/[&<>"]/g, c => ({{"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}})[c]);
+const WD = "월화수목금토일";
+function render(it) {{
+  const [y, m, d] = it.representativeVisitDateTime.slice(0, 10).split("-").map(Number);
+  const wd = WD[(new Date(Date.UTC(y, m - 1, d)).getUTCDay() + 6) % 7];
+  const li = document.createElement("li");
+  li.className = "place_apply_pui EjjAW";
+  li.innerHTML = '<div class="pui__vn15t2"><a data-pui-click-code="rvshowmore" role="button" href="#">' + esc(it.body) + '</a></div>'
+    + '<div class="pui__QKE5Pr"><span class="pui__gfuUIT"><span class="pui__blind">방문일</span><time aria-hidden="true">' + it.visited + '</time>'
+    + '<span class="pui__blind">' + y + '년 ' + m + '월 ' + d + '일 ' + wd + '요일</span></span>'
+    + '<span class="pui__gfuUIT">' + it.visitCount + '번째 방문</span><span class="pui__gfuUIT">영수증</span></div>';
+  return li;
+}}
+// 목록이 바뀔 때마다 버튼을 새로 만듦, REUSE_MORE면 처음 만든 요소를 숨김/표시만
+function renderMore() {{
+  const old = moreBox.querySelector("a");
+  if (REUSE_MORE && old) {{ old.style.display = loaded < TOTAL ? "" : "none"; return; }}
+  moreBox.innerHTML = loaded < TOTAL ? '<a role="button" href="#">펼쳐서 더보기</a>' : "";
+  const a = moreBox.querySelector("a");
+  if (a) a.addEventListener("click", e => {{ e.preventDefault(); loadMore(); }});
+}}
+async function loadMore() {{
+  if (loading || loaded >= TOTAL) return;
+  loading = true;
+  try {{
+    const r = await fetch("/graphql?place=" + PLACE + "&offset=" + loaded + "&limit=" + PAGE);
+    if (!r.ok) throw new Error(r.status);
+    const j = await r.json();
+    const frag = document.createDocumentFragment();
+    for (const it of j[0].data.visitorReviews.items) frag.appendChild(render(it));
+    list.appendChild(frag);
+    loaded += j[0].data.visitorReviews.items.length;
+  }} catch (e) {{
+  }} finally {{
+    loading = false;
+    renderMore();
+  }}
+}}
+document.querySelectorAll("a[role=tab]").forEach(a => a.addEventListener("click", e => {{
+  e.preventDefault();
+  document.querySelectorAll(".tab-panel").forEach(p => p.classList.remove("on"));
+  document.getElementById("tab-" + a.dataset.tab).classList.add("on");
+  reviewTab = a.dataset.tab === "review";
+  if (reviewTab && !loaded) loadMore();
+}}));
+document.getElementById("sortBtn").addEventListener("click", () => {{ document.getElementById("sortMenu").style.display = "block"; }});
+document.querySelectorAll("#sortMenu li").forEach(li => li.addEventListener("click", () => {{ document.getElementById("sortMenu").style.display = "none"; }}));
+window.addEventListener("scroll", () => {{
+  if (reviewTab && window.innerHeight + window.scrollY >= document.body.scrollHeight - 400) loadMore();
+}});
+</script>
+</body></html>"""
+
+MENU_ITEM = ('<li class="E2jtL"><div class="yQlqY"><span class="lPzHi">{name}</span>{sig}</div>'
+             '<div class="GXS1X"><em>{price:,}</em>원</div></li>')
+KEYWORD_ITEM = ('<li class="MHaAm"><span class="t3JSf">"{label}"</span>'
+                '<span class="CUoLy"><span class="place_blind">이 키워드를 선택한 인원</span>{count}</span></li>')
+
+class MockMapServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, **config):
+        self.config = {**DEFAULTS, **config}
+        self.names = {}  # place_id → 상호명 (검색 때 등록)
+        self.stats = {"requests": 0, "review_batches": 0, "failures": 0}
+        self.lock = threading.Lock()
+        self.rng = random.Random(self.config["seed"])
+        self.today = date.today()
+        super().__init__(addr, _Handler)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def name_of(self, pid):
+        return self.names.get(pid) or f"가게{pid}"
+
+    def fail(self, rate):
+        with self.lock:
+            return rate > 0 and self.rng.random() < rate
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body, ctype="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        srv, cfg = self.server, self.server.config
+        with srv.lock:
+            srv.stats["requests"] += 1
+        delay = cfg["latency_ms"] + random.uniform(-cfg["jitter_ms"], cfg["jitter_ms"])
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        url = urlparse(self.path)
+        path, qs = unquote(url.path), parse_qs(url.query)
+
+        if path.startswith("/graphql"):
+            if srv.fail(cfg["review_fail_rate"]):
+                with srv.lock:
+                    srv.stats["failures"] += 1
+                return self._send(500, "{}", "application/json")
+            return self._reviews(int(qs["place"][0]), int(qs.get("offset", ["0"])[0]), int(qs.get("limit", ["10"])[0]))
+
+        if path.startswith(("/restaurant/", "/search_list")) and srv.fail(cfg["page_fail_rate"]):
+            with srv.lock:
+                srv.stats["failures"] += 1
+            return self._send(500, "<h1>500</h1>")
+
+        m = re.match(r"^/p/search/([^/]+)(?:/place/(\d+))?$", path)
+        if m:
+            frames = f'<iframe id="searchIframe" src="/search_list?q={quote(m.group(1))}"></iframe>'
+            if m.group(2):
+                frames += f'<iframe id="entryIframe" src="/restaurant/{m.group(2)}/home"></iframe>'
+            return self._send(200, TOP_PAGE.format(title=escape(m.group(1)), frames=frames))
+
+        m = re.match(r"^/p/entry/place/(\d+)$", path)
+        if m:
+            frames = f'<iframe id="entryIframe" src="/restaurant/{m.group(1)}/home"></iframe>'
+            return self._send(200, TOP_PAGE.format(title=escape(srv.name_of(int(m.group(1)))), frames=frames))
+
+        if path == "/search_list":
+            return self._search(qs.get("q", [""])[0])
+
+        m = re.match(r"^/restaurant/(\d+)/(home|menu/list|review/visitor)$", path)
+        if m:
+            return self._entry(int(m.group(1)))
+
+        if path == "/stats":
+            return self._send(200, json.dumps(srv.stats), "application/json")
+        self._send(404, "<h1>404</h1>")
+
+    # 검색어와 같은 가게를 맨 위에, 나머지는 이웃 가게
+    def _search(self, q):
+        srv = self.server
+        names = [q] + [n for n in NEIGHBORS if n.replace(" ", "") != q.replace(" ", "")]
+        names = names[:srv.config["stores"]]
+        items = []
+        for n in names:
+            pid = place_id_of(n)
+            with srv.lock:
+                srv.names[pid] = n
+            items.append(SEARCH_ITEM.format(pid=pid, name=escape(n)))
+        self._send(200, SEARCH_LIST.format(q=escape(q), items="".join(items)))
+
+    def _entry(self, pid):
+        cfg, name = self.server.config, self.server.name_of(pid)
+        rnd = random.Random(pid)
+        menus = "".join(MENU_ITEM.format(name=escape(n), price=p, sig='<span class="place_blind">대표</span>' if i == 0 else "")
+                        for i, (n, p) in enumerate([("솥뚜껑 생삼겹살", 16000), ("솥뚜껑 목살", 16000),
+                                                    ("김치볶음밥", 4000), ("된장찌개", 3000)]))
+        keywords = "".join(KEYWORD_ITEM.format(label=p, count=rnd.randint(10, 900)) for p in PHRASES[:5])
+        self._send(200, ENTRY_PAGE.format(
+            name=escape(name), pid=pid, total=cfg["reviews"], blog=rnd.randint(50, 900),
+            road=rnd.randint(1, 30), no=rnd.randint(1, 99), menus=menus, keywords=keywords,
+            page_size=cfg["page_size"], reuse_more="true" if cfg["reuse_more_button"] else "false"))
+
+    def _reviews(self, pid, offset, limit):
+        srv = self.server
+        with srv.lock:
+            srv.stats["review_batches"] += 1
+        end = min(srv.config["reviews"], offset + limit)
+        items = [make_review(pid, i, srv.today) for i in range(offset, end)]
+        payload = [{"data": {"visitorReviews": {"total": srv.config["reviews"], "items": items}}}]
+        self._send(200, json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8")
+
+# 백그라운드 스레드로 서버 시작 → (server, base_url), 끝나면 server.shutdown()
+# config: DEFAULTS 키 (reviews, latency_ms, review_fail_rate ...)
+def start_server(port=0, **config):
+    server = MockMapServer(("127.0.0.1", port), **config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.base_url
+
+PORT = 8765
+
+if __name__ == "__main__":
+    import sys
+    server = MockMapServer(("127.0.0.1", int(sys.argv[1]) if len(sys.argv) > 1 else PORT))
+    print(f"{server.base_url}/p/search/{quote('와우 솥뚜껑삼겹살')}  (설정: {server.config})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,126 @@
+import re, json
+from datetime import datetime
+
+# 네트워크 응답(GraphQL)에서 방문자 리뷰를 바로 추출
+# 화면(DOM)의 pui__QKE5Pr / pui__vn15t2 클래스를 읽는 대신, 리뷰 목록을 불러오는 XHR 응답 JSON을 파싱
+# make_driver(network_log=True)로 크롬 performance 로그를 켜야 함
+
+VISITED_DATE = re.compile(r'(\d{2,4})\.(\d{1,2})\.(\d{1,2})') # "24.8.20.화" 형식 방문일
+
+# 날짜형식으로 변경 (review_date_count._to_iso 와 동일)
+def _to_iso(y, m, d):
+    try:
+        return datetime(int(y), int(m), int(d)).strftime("%Y-%m-%d")
+    except:
+        return None
+
+# 방문일 추출
+# representativeVisitDateTime("2024-08-20T00:00:00") 우선, 없으면 visited("24.8.20.화")
+def _visit_date(obj):
+    rv = obj.get("representativeVisitDateTime") or ""
+    m = re.match(r'(\d{4})-(\d{2})-(\d{2})', rv)
+    if m:
+        return _to_iso(m.group(1), m.group(2), m.group(3))
+
+    m = VISITED_DATE.search(obj.get("visited") or "")
+    if m:
+        y = int(m.group(1))
+        return _to_iso(y + 2000 if y < 100 else y, m.group(2), m.group(3))
+    return None
+
+# 방문횟수 추출 (DOM의 "N번째 방문"과 같은 값)
+def _visit_count(obj):
+    v = obj.get("visitCount")
+    try:
+        return int(v) if v is not None else None
+    except (TypeError, ValueError):
+        return None
+
+# 응답 JSON 안에서 리뷰 객체(body + 방문정보를 가진 dict)만 재귀적으로 찾기
+# 배치 GraphQL 응답([{data: ...}, ...])이나 필드 위치가 바뀌어도 동작하도록 구조를 가정하지 않음
+def _iter_review_objects(node):
+    if isinstance(node, dict):
+        if "body" in node and any(k in node for k in ("visitCount", "visited", "representativeVisitDateTime")):
+            yield node
+            return
+        for v in node.values():
+            yield from _iter_review_objects(v)
+    elif isinstance(node, list):
+        for v in node:
+            yield from _iter_review_objects(v)
+
+# 응답 JSON → [{visit_date, visit_count, review_text}, ...] (read_review_blocks 와 같은 형식)
+def parse_review_payload(payload):
+    if isinstance(payload, (str, bytes)):
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return []
+    out = []
+    for obj in _iter_review_objects(payload):
+        text = re.sub(r'\s+', ' ', (obj.get("body") or "")).strip()
+        out.append({
+            "visit_date": _visit_date(obj),
+            "visit_count": _visit_count(obj),
+            "review_text": text,
+        })
+    return out
+
+# 크롬 performance 로그에서 리뷰 응답만 골라 본문을 읽어오기
+# drain()을 부를 때마다 그 사이에 도착한 응답의 리뷰만 반환
+class NetworkReviewCapture:
+    def __init__(self, driver, url_pattern=r"graphql"):
+        self.driver = driver
+        self.url_re = re.compile(url_pattern)
+        self.pending = set()  # 응답 헤더는 왔지만 아직 본문 로딩이 끝나지 않은 요청
+        self.responses = 0    # 리뷰를 하나라도 담고 있던 응답 수
+
+    def _events(self):
+        try:
+            logs = self.driver.get_log("performance")
+        except Exception as e:
+            print(f"performance 로그 읽기 실패: {e}")
+            return
+        for entry in logs:
+            try:
+                yield json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+    def _body(self, request_id):
+        try:
+            res = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception:
+            return None # 오래된 응답은 브라우저가 이미 버렸을 수 있음
+        return res.get("body")
+
+    def drain(self):
+        finished = []
+        for ev in self._events():
+            method, params = ev.get("method"), ev.get("params", {})
+            if method == "Network.responseReceived":
+                if self.url_re.search(params.get("response", {}).get("url", "")):
+                    self.pending.add(params.get("requestId"))
+            elif method == "Network.loadingFinished" and params.get("requestId") in self.pending:
+                self.pending.discard(params["requestId"])
+                finished.append(params["requestId"])
+
+        items = []
+        for rid in finished:
+            body = self._body(rid)
+            if not body:
+                continue
+            found = parse_review_payload(body)
+            if found:
+                self.responses += 1
+                items.extend(found)
+        return items
+
+# 녹화해 둔 응답으로 오프라인 확인
+if __name__ == "__main__":
+    from pathlib import Path
+    fixture = Path(__file__).parent / "fixtures" / "visitor_reviews_graphql.json"
+    items = parse_review_payload(fixture.read_text(encoding="utf-8"))
+    for it in items:
+        print(it)
+    print(f"{len(items)}건")
@@ -0,0 +1,90 @@
+import os, time, asyncio
+from datetime import datetime
+
+import review_date_count as rdc
+from store_collector import crawl_store_all
+from place_cache import PLACE_CACHE
+from ratelimit import RateLimiter
+from session import BrowserSession
+
+# asyncio로 여러 브라우저 워커에 가게 작업을 나눠 주는 실행기
+# Selenium 호출은 블로킹이므로 워커마다 스레드(asyncio.to_thread)에서 실행하고,
+# 모든 워커가 하나의 RateLimiter를 공유 → 페이지 이동/클릭 속도는 여기 설정으로만 조절
+#
+# 속도 조절은 아래 설정만 바꾸면 됨
+# CONCURRENCY: 동시에 띄울 브라우저 수 (많을수록 대기 중인 워커가 줄어듦)
+# NAV_PER_SEC / CLICKS_PER_SEC: 전체 워커 합산 초당 페이지 이동 / 클릭 수 상한
+
+CONCURRENCY = 3
+NAV_PER_SEC = 0.5
+CLICKS_PER_SEC = 4.0
+DRIVER_PROFILE = "lean"
+JOB = "reviews" # "reviews": 리뷰만 (review_date_count.crawl_store), "all": 기본정보/메뉴/키워드/리뷰 (store_collector)
+
+# 속도는 limiter가 맞추므로 리뷰 수집의 고정 sleep은 끄고 DOM 변화 대기만 사용
+REVIEW_OPTS = dict(dom_wait=True, politeness=None, checkpoint=True)
+
+# 가게 1곳 처리 (워커 스레드에서 실행)
+def _run_job(session, job, nm, out_dir, opts):
+    if job == "all":
+        res = crawl_store_all(session, nm, out_dir, **opts)
+        return res["reviews"], bool(res["errors"])
+    return rdc.crawl_store(session.driver, session.wait, nm, **opts), False
+
+async def _worker(worker_id, jobs, results, limiter, job, out_dir, profile, opts):
+    session = BrowserSession(profile, network_log=opts.get("extract") == "network",
+                             user_data_dir=f"{rdc.USER_DATA_DIR}_w{worker_id}", limiter=limiter)
+    await asyncio.to_thread(session.start)
+    try:
+        while True:
+            try:
+                nm = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            print(f"\n [w{worker_id}] {nm} 수집 시작 ")
+            t0 = time.time()
+            try:
+                n, failed = await asyncio.to_thread(_run_job, session, job, nm, out_dir, opts)
+            except Exception as e:
+                print(f" [w{worker_id}] 실패: {nm} → {e}")
+                PLACE_CACHE.invalidate(nm)
+                n, failed = 0, True
+            results[nm] = {"rows": n, "failed": failed, "secs": round(time.time() - t0, 1), "worker": worker_id}
+            await asyncio.to_thread(session.store_done, failed)
+    finally:
+        await asyncio.to_thread(session.close)
+
+# store_names 전체를 concurrency개 브라우저로 수집
+# limiter를 넘기지 않으면 nav_per_sec / clicks_per_sec로 새로 만듦
+async def crawl_async(store_names, concurrency=CONCURRENCY, job=JOB, profile=DRIVER_PROFILE,
+                      nav_per_sec=NAV_PER_SEC, clicks_per_sec=CLICKS_PER_SEC, limiter=None, out_dir=None, **opts):
+    limiter = limiter or RateLimiter(nav_per_sec, clicks_per_sec)
+    out_dir = out_dir or rdc.BASE_DIR
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = asyncio.Queue()
+    for nm in store_names:
+        jobs.put_nowait(nm)
+
+    results = {}
+    concurrency = max(1, min(concurrency, len(store_names)))
+    t0 = time.time()
+    await asyncio.gather(*[
+        _worker(i, jobs, results, limiter, job, out_dir, profile, opts) for i in range(1, concurrency + 1)
+    ])
+
+    wall = time.time() - t0
+    total = sum(r["rows"] for r in results.values())
+    st = limiter.stats()
+    print(f"\n전체 {len(store_names)}곳 / {total}건, {wall:.0f}초 (동시 {concurrency}개)")
+    print(f"  이동 {st['navigations']}회 (대기 {st['nav_wait_s']}초), 클릭 {st['clicks']}회 (대기 {st['click_wait_s']}초)")
+    return {nm: results.get(nm) for nm in store_names}
+
+def crawl(store_names, **kwargs):
+    return asyncio.run(crawl_async(store_names, **kwargs))
+
+if __name__ == "__main__":
+    out_dir = None
+    if JOB == "all":
+        out_dir = os.path.join(rdc.BASE_DIR, f"stores_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    crawl(rdc.names, out_dir=out_dir, **REVIEW_OPTS)
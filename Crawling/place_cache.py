@@ -0,0 +1,102 @@
+import os, re, json, time, threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# 가게명(검색어) → 플레이스 ID / 상세페이지 URL 캐시
+# 한 번 검색으로 찾은 가게는 다음 실행부터 검색 페이지(searchIframe)를 거치지 않고 상세페이지로 바로 이동
+# 파일(JSON)에 저장되므로 실행 간에 유지되고, 여러 수집기(basic_info / menu / keyword_reviews / review_date_count)가 같이 사용
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".naver_place_cache.json")
+DEFAULT_TTL_DAYS = 14 # 이 기간이 지나면 다시 검색 (상호 변경/이전 대비)
+
+ENTRY_URL = "https://map.naver.com/p/entry/place/{}"
+
+# 상위 URL(.../place/1234567) 또는 entryIframe src(pcmap.place.naver.com/restaurant/1234567/home)에서 ID 추출
+PLACE_ID_RE = re.compile(r'/(?:place|restaurant|cafe|hospital|hairshop|accommodation)/(\d+)')
+
+def _key(query_name):
+    return re.sub(r"\s+", " ", query_name).strip()
+
+class PlaceCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=DEFAULT_TTL_DAYS):
+        self.path, self.ttl = path, ttl_days * 86400
+        self.lock = threading.Lock() # 병렬 워커가 같은 캐시 사용
+        self.hits = self.misses = 0
+        self.data = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+
+    # 유효한 항목만 반환 (없거나 TTL 지났으면 None)
+    def get(self, query_name):
+        with self.lock:
+            ent = self.data.get(_key(query_name))
+        if ent and time.time() - ent.get("resolved_at", 0) < self.ttl:
+            return ent
+        return None
+
+    def put(self, query_name, place_id, entry_url):
+        with self.lock:
+            self.data[_key(query_name)] = {
+                "place_id": place_id, "entry_url": entry_url, "resolved_at": time.time(),
+            }
+            self._save()
+
+    # 캐시된 URL로 열기 실패, 수집 실패 등 → 다음에는 다시 검색
+    def invalidate(self, query_name):
+        with self.lock:
+            if self.data.pop(_key(query_name), None) is not None:
+                self._save()
+
+PLACE_CACHE = PlaceCache()
+
+# 검색으로 entryIframe을 연 직후 현재 가게의 ID 읽기 (못 찾으면 None)
+def current_place_id(driver):
+    driver.switch_to.default_content()
+    urls = [driver.current_url]
+    for fr in driver.find_elements(By.CSS_SELECTOR, "iframe#entryIframe"):
+        urls.append(fr.get_attribute("src") or "")
+    for u in urls:
+        m = PLACE_ID_RE.search(u or "")
+        if m:
+            return m.group(1)
+    return None
+
+# 상세페이지 URL로 바로 이동 → entryIframe 전환
+def _open_entry_direct(driver, wait, entry_url):
+    driver.switch_to.default_content()
+    driver.get(entry_url)
+    wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe")))
+
+# 캐시에 있으면 바로 이동, 없거나 실패하면 search_fn(driver, wait, query_name)으로 검색 후 캐시에 저장
+# search_fn: 각 수집기의 open_entry_by_search (끝나면 entryIframe 안에 있어야 함)
+# 반환: 플레이스 ID (못 읽었으면 None), 끝나면 entryIframe 안
+def open_entry_cached(driver, wait, query_name, search_fn, cache=None):
+    cache = cache or PLACE_CACHE
+    ent = cache.get(query_name)
+    if ent:
+        try:
+            _open_entry_direct(driver, wait, ent["entry_url"])
+            cache.hits += 1
+            return ent["place_id"]
+        except TimeoutException:
+            print(f"  캐시된 주소로 열기 실패 → 다시 검색: {query_name}")
+            cache.invalidate(query_name)
+
+    cache.misses += 1
+    search_fn(driver, wait, query_name)
+    place_id = current_place_id(driver)
+    if place_id:
+        cache.put(query_name, place_id, ENTRY_URL.format(place_id))
+    wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe")))
+    return place_id
@@ -0,0 +1,95 @@
+import time, threading
+
+# 전역 요청 속도 제한 (토큰 버킷)
+# 여러 브라우저 워커가 같은 RateLimiter를 공유 → 페이지 이동/클릭 총량을 한 곳에서 제한
+# 각 파일의 sleep 상수를 고치지 않고 여기 숫자만 바꿔서 속도 조절
+
+class TokenBucket:
+    # rate: 초당 토큰 수, burst: 한 번에 몰아서 쓸 수 있는 최대 토큰 수
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.t_last = time.monotonic()
+        self.lock = threading.Lock()
+        self.waited = 0.0 # 토큰을 기다린 총 시간 (너무 크면 rate를 올려도 됨)
+        self.taken = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.t_last) * self.rate)
+        self.t_last = now
+
+    # 토큰 1개를 얻을 때까지 대기 (스레드 안전)
+    def acquire(self):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.taken += 1
+                    return
+                need = (1 - self.tokens) / self.rate
+                self.waited += need
+            time.sleep(need)
+
+    # 이미 써 버린 n개를 나중에 차감 (음수가 되면 다음 acquire가 그만큼 더 기다림)
+    def charge(self, n):
+        with self.lock:
+            self._refill()
+            self.tokens -= n
+            self.taken += n
+
+    # 지금 바로 쓸 수 있는 토큰 수 (최소 1 → 기다려서라도 1번은 진행)
+    def available(self):
+        with self.lock:
+            self._refill()
+            return max(1, int(self.tokens))
+
+# WebDriver 명령 중 어떤 것을 제한할지
+# nav  : 페이지 이동 (driver.get, 뒤로/앞으로/새로고침)
+# click: 요소 클릭, 그리고 스크립트 안의 .click() (arguments[0].click(), 펼쳐서 더보기 일괄 클릭 등)
+#        스크립트 1번은 클릭 1번으로 계산 → 여러 번 누르는 일괄 클릭 스크립트는 호출한 쪽에서
+#        click_budget() 이하로만 누르고 나머지를 charge_clicks()로 차감 (review_date_count.expand_folds_js)
+NAV_COMMANDS = {"get", "goBack", "goForward", "refresh"}
+SCRIPT_COMMANDS = {"w3cExecuteScript", "w3cExecuteScriptAsync"}
+
+class RateLimiter:
+    def __init__(self, nav_per_sec=0.5, clicks_per_sec=4.0, nav_burst=1, click_burst=4):
+        self.nav = TokenBucket(nav_per_sec, nav_burst)
+        self.click = TokenBucket(clicks_per_sec, click_burst)
+
+    # driver.execute를 감싸 이동/클릭 명령 앞에서 토큰 대기
+    # BrowserSession(limiter=...)이 브라우저를 (재)시작할 때마다 호출
+    def install(self, driver):
+        if getattr(driver, "_rate_limiter", None) is self:
+            return
+        orig = getattr(driver, "_unlimited_execute", None) or driver.execute
+        driver._unlimited_execute = orig
+        driver._rate_limiter = self
+
+        def execute(command, params=None):
+            if command in NAV_COMMANDS:
+                self.nav.acquire()
+            elif command == "clickElement":
+                self.click.acquire()
+            elif command in SCRIPT_COMMANDS and ".click()" in ((params or {}).get("script") or ""):
+                self.click.acquire()
+            return orig(command, params)
+
+        driver.execute = execute
+
+    # 한 번의 스크립트로 눌러도 되는 클릭 수
+    def click_budget(self):
+        return self.click.available()
+
+    # 스크립트 1번으로 n번 클릭했을 때 추가 차감 (스크립트 실행 시 이미 1개를 씀)
+    def charge_clicks(self, n):
+        if n > 1:
+            self.click.charge(n - 1)
+
+    def stats(self):
+        return {
+            "navigations": self.nav.taken, "nav_wait_s": round(self.nav.waited, 1),
+            "clicks": self.click.taken, "click_wait_s": round(self.click.waited, 1),
+        }
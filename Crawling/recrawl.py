@@ -0,0 +1,131 @@
+import os, time
+
+import review_date_count as rdc
+from basic_info import _extract_home_basic
+from history import HistoryStore, now_str
+from http_fetch import make_fetcher, fetch_store
+from place_cache import PLACE_CACHE, open_entry_cached
+from session import BrowserSession
+
+# 리뷰 수 변화 기반 재수집 스케줄러
+# 1) 가게마다 홈 탭의 방문자/블로그 리뷰 수만 확인 (place_cache에 있는 가게는 HTTP 요청 1번, 없으면 브라우저로 페이지 1번 로딩)
+# 2) 마지막으로 리뷰 수집에 성공했을 때의 방문자 리뷰 수(_state 파일의 visitor_reviews)와 비교해 바뀐 가게만 수집 대상으로
+#    - history의 home_snapshots는 basic_info / store_collector / 수집 실패한 실행도 기록하므로 비교 기준으로 쓰지 않음
+#    - visitor_reviews는 crawl_store가 성공한 뒤에만 저장 → 실패/dry_run이면 다음 실행에서 다시 대상이 됨
+# 3) 새 리뷰가 많을 것으로 예상되는 가게부터 수집
+#    - 항상 collect_reviews_full(incremental=True, since=None)로 실행 → 이전 수집 상태(_state)가 없으면 전체를 수집하면서 상태를 만듦
+#      (incremental=False로 돌리면 상태가 저장되지 않아 다음에도 계속 전체 수집이 됨)
+#    - since="last"는 늦게 올라온 리뷰를 빠뜨리므로 쓰지 않음, 이미 수집된 key를 만나면 멈추는 것으로 충분
+# 대부분의 가게는 대부분의 날 변화가 없으므로 스크롤 수집 없이 끝남
+
+STATE_DIR = os.path.join(rdc.BASE_DIR, "_state")
+
+# 홈 탭 수치만 확인
+# fetcher: http_fetch.PlaceFetcher → 이전에 찾은 가게는 브라우저 없이 HTTP 요청 1번으로 (실패하면 브라우저로)
+def probe_store(session, store, fetcher=None):
+    if fetcher is not None:
+        res = fetch_store(store, fetcher, session, menus=False)
+        if res["source"] == "http":
+            # HTTP 쪽 상호명도 place_title과 같은 규칙(og:title)으로 읽음
+            return {"store": store, "home": res["home"], "title": res["home"]["name"]}
+        home = res["home"]
+    else:
+        session.start()
+        open_entry_cached(session.driver, session.wait, store, rdc.open_entry_by_search)
+        home = _extract_home_basic(session.driver, session.wait)
+    # 증분 상태 파일은 리뷰 수집 때의 place_title 기준으로 저장됨
+    return {"store": store, "home": home, "title": rdc.place_title(session.driver)}
+
+# 마지막 수집 성공 시점의 방문자 리뷰 수 (상태 파일이 없거나 기록 전이면 None)
+def crawled_count(state_dir, title):
+    if not os.path.exists(rdc._state_path(state_dir, title)):
+        return None
+    return rdc.load_crawl_state(state_dir, title).get("visitor_reviews")
+
+# 수집 성공 후 → 이번에 확인한 방문자 리뷰 수를 상태 파일에 기록 (다음 실행의 비교 기준)
+# 상태 파일이 없으면 (수집 때 상호명이 달라진 경우 등) 기록하지 않음 → 다음 실행에서 다시 전체 대상
+def mark_crawled(state_dir, title, visitor_reviews):
+    if not os.path.exists(rdc._state_path(state_dir, title)):
+        return
+    state = rdc.load_crawl_state(state_dir, title)
+    extra = {k: v for k, v in state.items() if k not in ("place_name", "newest_visit_date", "updated_at", "keys")}
+    extra["visitor_reviews"] = visitor_reviews
+    rdc.save_crawl_state(state_dir, title, state["keys"], state.get("newest_visit_date"), **extra)
+
+# 확인 결과 → 수집 작업 (없으면 None)
+# expected: 새로 생겼을 것으로 예상되는 리뷰 수 (우선순위)
+def plan_job(probe, state_dir=STATE_DIR):
+    cur = probe["home"].get("visitor_reviews")
+    title = probe["title"] or probe["store"]
+    job = {"store": probe["store"], "title": title, "visitor_reviews": cur}
+
+    if cur is None:
+        return None # 수치를 못 읽음 → 판단 불가, 다음 실행에서 다시 확인
+    prev = crawled_count(state_dir, title)
+    if prev is None:
+        return {**job, "mode": "full", "expected": cur, "reason": "이전 수집 기록 없음"}
+
+    delta = cur - prev
+    if delta == 0:
+        return None
+    if delta < 0:
+        # 리뷰가 삭제/숨김 처리됨 → 그 사이 새 리뷰가 있을 수도 있으니 증분 수집 (우선순위는 가장 낮게)
+        return {**job, "mode": "incremental", "expected": 0, "reason": f"리뷰 {delta}건"}
+    return {**job, "mode": "incremental", "expected": delta, "reason": f"리뷰 +{delta}건"}
+
+# store_names 확인 → 변화 있는 가게만 수집
+# crawl_opts: crawl_store 옵션 (dom_wait, politeness ...), incremental/since는 여기서 정함
+# history: 확인한 홈 수치를 기록만 함 (비교에는 쓰지 않음), dry_run이면 아무것도 기록하지 않음
+# fetcher: 확인 단계에 쓸 http_fetch.PlaceFetcher (None이면 브라우저로 확인)
+def run_schedule(store_names, session, history, state_dir=STATE_DIR, dry_run=False, fetcher=None, **crawl_opts):
+    snapshot_at = now_str()
+
+    # 1) 확인
+    t0 = time.time()
+    jobs = []
+    for store in store_names:
+        failed = False
+        try:
+            probe = probe_store(session, store, fetcher)
+            if not dry_run:
+                history.add_home(store, probe["home"], snapshot_at)
+            job = plan_job(probe, state_dir)
+            if job:
+                jobs.append(job)
+        except Exception as e:
+            print(f" 확인 실패: {store} → {e}")
+            PLACE_CACHE.invalidate(store)
+            failed = True
+        session.store_done(failed)
+    jobs.sort(key=lambda j: j["expected"], reverse=True)
+    print(f"\n확인 {len(store_names)}곳 ({time.time() - t0:.0f}초) → 수집 대상 {len(jobs)}곳")
+    for j in jobs:
+        print(f"  {j['store']}: {j['mode']} ({j['reason']})")
+    if dry_run:
+        return jobs
+
+    # 2) 수집 (예상 신규 리뷰 많은 순)
+    if jobs:
+        session.start()
+    for j in jobs:
+        failed = False
+        try:
+            j["rows"] = rdc.crawl_store(session.driver, session.wait, j["store"], incremental=True,
+                                        since=None, state_dir=state_dir, **crawl_opts)
+            mark_crawled(state_dir, j["title"], j["visitor_reviews"])
+        except Exception as e:
+            print(f" 실패: {j['store']} → {e}")
+            PLACE_CACHE.invalidate(j["store"])
+            j["rows"], failed = 0, True
+        session.store_done(failed)
+    return jobs
+
+DRY_RUN = False # True: 확인만 하고 수집 대상 목록만 출력
+
+if __name__ == "__main__":
+    opts = dict(rdc.CRAWL_OPTS)
+    for k in ("incremental", "since"):
+        opts.pop(k, None)
+    with BrowserSession(rdc.DRIVER_PROFILE, network_log=rdc.EXTRACT == "network",
+                        user_data_dir=rdc.USER_DATA_DIR, lazy=True) as session, HistoryStore() as history:
+        run_schedule(rdc.names, session, history, dry_run=DRY_RUN, fetcher=make_fetcher(), **opts)
@@ -1,28 +1,23 @@
-import os, re, csv, time, random, hashlib
+import os, re, csv, json, time, random, shutil, queue, threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from network_reviews import NetworkReviewCapture
+from session import BrowserSession, make_driver
+from telemetry import CrawlTelemetry, NULL_TELEMETRY, print_summary
+from place_cache import PLACE_CACHE, open_entry_cached
+from dedup import DigestSet, digest64
 
 # 설정
 BASE_DIR = r"D:\crawl_result"
+MAP_BASE = "https://map.naver.com" # 부하 테스트 때는 mock_map_server 주소로 교체 (bench_crawl.py)
 os.makedirs(BASE_DIR, exist_ok=True)
 
 # 사람처럼 보이기 위한 랜덤 딜레이
 def human_delay(min_sec=0.3, max_sec=0.8):
     time.sleep(random.uniform(min_sec, max_sec))
 
-# 드라이버 설정 및 새 chrome 브라우저 실행
-def make_driver():
-    opts = webdriver.ChromeOptions() # 크롬 실행 옵션 생성
-    opts.add_argument("--disable-gpu") # gpu 비활성화 → 서버 등에서 렌더링 이슈 방지 
-    opts.add_argument("--no-sandbox") # 샌드박스 모드 비활성화 → 권한 문제 방지
-    opts.add_argument("--start-maximized") # 브라우저 최대화 실행
-    opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36") # User-Agent 설정 → 크롤링 차단 방지용
-    
-    return webdriver.Chrome(options=opts) # 위 설정으로 새 Chrome 브라우저 실행
-
 # entryIframe로 전환
 def ensure_entry_iframe(driver, wait):
     driver.switch_to.default_content()
@@ -35,13 +30,29 @@ def place_title(driver):
       return (og && og.content) ? og.content : document.title;
     """) or "").split(" :")[0].strip()
 
+# searchIframe 안의 클릭 가능한 가게 버튼 목록
+def search_candidates(driver):
+    cand = driver.find_elements(
+        By.XPATH,
+        "//a[@role='button' and contains(@class,'place_bluelink')]"
+        " | //a[@role='button'][.//span[contains(@class,'TYaxT')]]"
+    )
+    if not cand:
+        spans = driver.find_elements(By.CSS_SELECTOR, "span.TYaxT")
+        if spans:
+            try:
+                cand = [spans[0].find_element(By.XPATH, "./ancestor::a[@role='button'][1]")]
+            except:
+                pass
+    return cand
+
 # 특정 가게 리뷰 사이트 안으로 들어가기
 def open_entry_by_search(driver, wait, query_name):
     from urllib.parse import quote
 
     # 가게명 입력 → 네이버 리뷰 사이트 들어가기
     driver.switch_to.default_content()
-    driver.get(f"https://map.naver.com/p/search/{quote(query_name)}")
+    driver.get(f"{MAP_BASE}/p/search/{quote(query_name)}")
     human_delay(1.0, 1.5)
 
     # entryIframe로 전환
@@ -53,18 +64,7 @@ def open_entry_by_search(driver, wait, query_name):
     human_delay(0.6, 1.0)
 
     # 가게이름 탐색
-    cand = driver.find_elements(
-        By.XPATH,
-        "//a[@role='button' and contains(@class,'place_bluelink')]"
-        " | //a[@role='button'][.//span[contains(@class,'TYaxT')]]"
-    )
-    if not cand:
-        spans = driver.find_elements(By.CSS_SELECTOR, "span.TYaxT")
-        if spans:
-            try:
-                cand = [spans[0].find_element(By.XPATH, "./ancestor::a[@role='button'][1]")]
-            except:
-                pass
+    cand = search_candidates(driver)
     if not cand:
         raise RuntimeError("검색 결과 없음")
 
@@ -91,6 +91,7 @@ def go_reviews_tab(driver, wait):
 
 # "펼쳐서 더보기" 탭 클릭 (더보기 탭은 다른 탭!)
 # 펼쳐서 더보기 생길때마다 클릭
+# sleep_range=None이면 클릭 사이 대기 없음
 def click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25)):
     ensure_entry_iframe(driver, wait) # 전환
     clicked = 0 # 몇번 눌렀는지 카운트
@@ -118,20 +119,188 @@ def click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25)
                 if "펼쳐서 더보기" not in t:
                     continue
                 driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn) # 중앙으로
-                human_delay(0.1, 0.2)
+                if sleep_range:
+                    human_delay(0.1, 0.2)
                 driver.execute_script("arguments[0].click();", btn) # 클릭
                 clicked += 1
-                time.sleep(random.uniform(*sleep_range))
+                if sleep_range:
+                    time.sleep(random.uniform(*sleep_range))
             except:
                 continue
-        human_delay(0.2, 0.4)
+        if sleep_range:
+            human_delay(0.2, 0.4)
     return clicked
 
+# "펼쳐서 더보기"를 스크립트 1번으로 모두 클릭 (버튼마다 find/is_displayed/click 왕복 없음)
+# 이번 호출에서 누른 버튼만 기억 → passes번까지 새 버튼이 없을 때까지 반복
+# (더보기 버튼은 다음 라운드에 같은 요소가 남아 있을 수 있으므로 페이지에 표시를 남기지 않음)
+FOLD_EXPAND_JS = """
+const maxClicks = arguments[0], passes = arguments[1];
+const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+const done = new Set();
+let clicked = 0;
+for (let p = 0; p < passes; p++) {
+  const btns = Array.from(document.querySelectorAll("a, button")).filter(el =>
+    !done.has(el) && (el.textContent || "").includes("펼쳐서 더보기") && visible(el));
+  if (!btns.length) break;
+  for (const el of btns) {
+    if (clicked >= maxClicks) return clicked;
+    done.add(el);
+    try { el.click(); clicked++; } catch (e) {}
+  }
+}
+return clicked;
+"""
+
+# 클릭 수 반환, 스크립트 실행 실패 시 None (→ click_fold_expand_all로 폴백)
+# RateLimiter가 설치된 드라이버면 남은 클릭 토큰만큼만 누르고 실제 클릭 수만큼 차감 (나머지는 다음 라운드에)
+def expand_folds_js(driver, max_clicks=999, repeat=True):
+    limiter = getattr(driver, "_rate_limiter", None)
+    if limiter is not None:
+        max_clicks = min(max_clicks, limiter.click_budget())
+    try:
+        clicked = driver.execute_script(FOLD_EXPAND_JS, max_clicks, 8 if repeat else 1) or 0
+        if limiter is not None:
+            limiter.charge_clicks(clicked)
+        return clicked
+    except Exception as e:
+        print(f"펼쳐서 더보기 스크립트 오류: {e}")
+        return None
+
 def small_bounce_scroll(driver, px=600, jitter=120, sleep_range=(0.25, 0.45)):
     # 스크롤을 천천히 움직이면서 하나씩 추출
     j = random.randint(-jitter, jitter)
     driver.execute_script(f"window.scrollBy(0,{px + j});")
-    time.sleep(random.uniform(*sleep_range))
+    if sleep_range:
+        time.sleep(random.uniform(*sleep_range))
+
+# 스크롤 위치 한 번에 읽기 (y, 페이지 높이, 화면 높이)
+SCROLL_POS_JS = "return [window.scrollY, document.body.scrollHeight, window.innerHeight];"
+
+# 라운드별 신규 리뷰 수에 맞춰 스크롤 간격 조절
+# 새 리뷰가 계속 나오면 간격을 늘리고(라운드 수 감소), 안 나오면 줄이거나
+# 목록이 맨 아래에서만 늘어나는 상황(위쪽은 이미 처리됨)이면 바로 맨 아래로 이동
+class AdaptiveScroll:
+    def __init__(self, base_step, min_ratio=0.4, max_ratio=3.0, grow=1.5, shrink=0.6,
+                 jump_after=2, recover_after=8):
+        self.base = base_step
+        self.step = base_step
+        self.min_step, self.max_step = int(base_step * min_ratio), int(base_step * max_ratio)
+        self.grow, self.shrink = grow, shrink
+        self.jump_after = jump_after       # 연속 N라운드 신규 0건 + 아래에 남은 거리가 크면 맨 아래로
+        self.recover_after = recover_after # 연속 N라운드 신규 0건이면 idle 보강 시퀀스
+        self.hits = self.misses = 0        # 연속 신규 있음 / 없음 라운드 수
+
+    # 이번 라운드 결과 → 다음 이동 ("step", "bottom")
+    # pos: SCROLL_POS_JS 결과
+    def next_move(self, round_new, pos):
+        if round_new > 0:
+            self.hits += 1
+            self.misses = 0
+            if self.hits >= 2:
+                self.step = min(self.max_step, int(self.step * self.grow))
+            return "step"
+
+        self.hits = 0
+        self.misses += 1
+        self.step = max(self.min_step, int(self.step * self.shrink))
+        y, height, view = pos
+        if self.misses >= self.jump_after and height - (y + view) > 2 * view:
+            return "bottom"
+        return "step"
+
+    def should_recover(self):
+        return self.misses >= self.recover_after
+
+    # 보강 시퀀스 이후 다시 기본 간격부터
+    def reset(self):
+        self.step, self.hits, self.misses = self.base, 0, 0
+
+# 현재 페이지의 리뷰 노드 수 (find_review_blocks와 같은 기준)
+# prune_reviews로 지운 노드 수(body data-rv-pruned)도 더함 → 지워도 개수는 줄지 않음 (dom_wait 기준값 유지)
+REVIEW_COUNT_JS = """
+return (document.querySelectorAll("li.place_apply_pui, li.EjjAW").length
+    || document.querySelectorAll("div.pui__QKE5Pr").length) + (+document.body.dataset.rvPruned || 0);
+"""
+
+# 리뷰 노드가 prev개보다 많아지면 바로, 아니면 timeout 뒤에 현재 개수 반환 (MutationObserver)
+WAIT_NEW_REVIEWS_JS = """
+const done = arguments[arguments.length - 1];
+const prev = arguments[0], timeoutMs = arguments[1];
+const count = () => (document.querySelectorAll("li.place_apply_pui, li.EjjAW").length
+    || document.querySelectorAll("div.pui__QKE5Pr").length) + (+document.body.dataset.rvPruned || 0);
+if (count() > prev) { done(count()); return; }
+let finished = false, timer = null;
+const obs = new MutationObserver(() => { if (count() > prev) finish(); });
+function finish() {
+  if (finished) return;
+  finished = true;
+  obs.disconnect();
+  clearTimeout(timer);
+  done(count());
+}
+obs.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(finish, timeoutMs);
+"""
+
+# 처리 끝난(data-rv-done) 리뷰 노드를 DOM에서 제거, 마지막 keep개는 남김
+# 지운 노드들의 높이만큼 빈 칸(data-rv-spacer) 하나로 대체 → 스크롤 위치/페이지 높이가 그대로라 아래쪽 추가 로딩도 그대로 동작
+# 높이는 지우는 노드마다 자기 높이 + margin을 더함 (처음~끝 구간으로 재면 사이에 남는 다른 노드까지 들어가 조금씩 밀림)
+PRUNE_REVIEWS_JS = """
+const keep = arguments[0];
+const done = Array.from(document.querySelectorAll("[data-rv-done]"));
+const victims = done.slice(0, Math.max(0, done.length - keep));
+if (!victims.length) return 0;
+const first = victims[0];
+let h = 0, prev = null, prevMb = 0;
+for (const el of victims) {
+  const cs = getComputedStyle(el);
+  const mt = parseFloat(cs.marginTop) || 0, mb = parseFloat(cs.marginBottom) || 0;
+  // 바로 이어지는 형제끼리는 세로 margin이 겹치므로 큰 쪽만
+  h += el.getBoundingClientRect().height + mb + (prev && prev.nextElementSibling === el ? Math.max(0, mt - prevMb) : mt);
+  prev = el; prevMb = mb;
+}
+let spacer = document.querySelector("[data-rv-spacer]");
+if (!spacer || spacer.parentNode !== first.parentNode) {
+  spacer = document.createElement(first.tagName === "LI" ? "li" : "div");
+  spacer.setAttribute("data-rv-spacer", "1");
+  spacer.style.cssText = "height:0px;list-style:none;margin:0;padding:0;";
+  first.parentNode.insertBefore(spacer, first);
+}
+spacer.style.height = (parseFloat(spacer.style.height) + Math.max(0, h)) + "px";
+victims.forEach(el => el.remove());
+document.body.dataset.rvPruned = (+document.body.dataset.rvPruned || 0) + victims.length;
+return victims.length;
+"""
+
+def prune_reviews(driver, keep=30):
+    try:
+        return driver.execute_script(PRUNE_REVIEWS_JS, keep)
+    except Exception as e:
+        print(f"리뷰 노드 정리 실패: {e}")
+        return None
+
+# 스크롤 후 고정 sleep 대신 새 리뷰가 붙는 순간까지만 대기
+# 비동기 스크립트가 실패하면 개수 폴링으로 대체
+def wait_for_new_reviews(driver, prev_count, timeout=1.5, poll=0.1):
+    try:
+        return driver.execute_async_script(WAIT_NEW_REVIEWS_JS, prev_count, int(timeout * 1000))
+    except Exception:
+        pass
+    end = time.time() + timeout
+    while True:
+        try:
+            n = driver.execute_script(REVIEW_COUNT_JS) or 0
+        except Exception:
+            n = 0
+        if n > prev_count or time.time() >= end:
+            return n
+        time.sleep(poll)
+
+# 예의상 지연 (politeness=(min, max) 초, None이면 지연 없음)
+def polite_delay(politeness):
+    if politeness:
+        human_delay(*politeness)
 
 DATE_KOR = re.compile(r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일') # 날짜 문자열 인식/추출
 VISIT_NTH = re.compile(r'(\d{1,3})\s*번째\s*방문') # 방문 횟수 추출
@@ -232,7 +401,106 @@ def find_review_blocks(driver):
     # 마지막 폴백
     return driver.find_elements(By.CSS_SELECTOR, "div.pui__QKE5Pr")
 
-import re, hashlib, random, time
+# 페이지 안의 모든 리뷰 블록을 execute_script 1번으로 파싱
+# find_review_blocks / parse_visit_block / extract_review_text 와 같은 선택자·폴백 순서를 그대로 따름
+# arguments[0]=true: 처리한 블록에 data-rv-done 표시 → 다음 호출부터는 새로 붙은 블록만 파싱
+# 반환: [{visit_date, visit_count, review_text}, ...]
+EXTRACT_REVIEWS_JS = r"""
+const onlyNew = !!arguments[0];
+const DATE_KOR = /(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일/;
+const VISIT_NTH = /(\d{1,3})\s*번째\s*방문/;
+const txt = el => ((el && el.textContent) || "").trim();
+const pad = n => String(n).padStart(2, "0");
+
+// _to_iso 와 동일: 존재하지 않는 날짜면 null
+function toIso(y, m, d) {
+  y = +y; m = +m; d = +d;
+  if (y < 1) return null;
+  const dt = new Date(0);
+  dt.setUTCFullYear(y, m - 1, d);
+  if (dt.getUTCFullYear() !== y || dt.getUTCMonth() !== m - 1 || dt.getUTCDate() !== d) return null;
+  return String(y).padStart(4, "0") + "-" + pad(m) + "-" + pad(d);
+}
+
+// find_review_blocks 폴백 순서
+function findBlocks() {
+  let blocks = Array.from(document.querySelectorAll("li.place_apply_pui, li.EjjAW"));
+  if (blocks.length) return blocks;
+  const seen = new Set();
+  document.querySelectorAll("div.pui__QKE5Pr").forEach(d => {
+    const li = d.closest("li");
+    if (li && !seen.has(li)) { seen.add(li); blocks.push(li); }
+  });
+  if (blocks.length) return blocks;
+  return Array.from(document.querySelectorAll("div.pui__QKE5Pr"));
+}
+
+// parse_visit_block
+function parseVisit(b) {
+  const div = b.querySelector("div.pui__QKE5Pr");
+  if (!div) return [null, null];
+  let date = null;
+  for (const el of div.querySelectorAll(".pui__blind")) {
+    const m = DATE_KOR.exec(txt(el));
+    if (m) { date = toIso(m[1], m[2], m[3]); if (date) break; }
+  }
+  const m2 = VISIT_NTH.exec(txt(div));
+  return [date, m2 ? parseInt(m2[1], 10) : null];
+}
+
+// extract_review_text 의 3단계 폴백
+function reviewText(b) {
+  const sel = 'a[data-pui-click-code="rvshowmore"]';
+  const box = b.querySelector("div.pui__vn15t2");
+  let t = box ? txt(box.querySelector(sel)) : "";
+  if (t) return t.replace(/\s+/g, " ");
+  t = txt(b.querySelector(sel));
+  if (t) return t.replace(/\s+/g, " ");
+  const x = document.evaluate(".//a[@data-pui-click-code='rvshowmore']", b, null,
+                              XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  t = txt(x);
+  return t ? t.replace(/\s+/g, " ") : "";
+}
+
+let blocks = findBlocks();
+if (onlyNew) blocks = blocks.filter(b => !b.hasAttribute("data-rv-done"));
+return blocks.map(b => {
+  try {
+    const [visit_date, visit_count] = parseVisit(b);
+    // 방문정보가 아직 렌더링 전이면 표시하지 않음 → 다음 라운드에 다시 파싱
+    if (onlyNew && (visit_date !== null || visit_count !== null)) b.setAttribute("data-rv-done", "1");
+    return {visit_date, visit_count, review_text: reviewText(b)};
+  } catch (e) {
+    return null;
+  }
+}).filter(Boolean);
+"""
+
+# 리뷰 블록 한 번에 읽기
+# only_new=True: 이전 호출에서 처리한 블록은 건너뜀 (라운드당 비용이 누적 리뷰 수와 무관)
+# 스크립트 실행이 실패하면 기존 방식(블록마다 find_elements)으로 폴백
+# js=False: 처음부터 기존 방식만 사용 (비교/측정용, only_new 무시)
+def read_review_blocks(driver, only_new=False, js=True):
+    items = None
+    if js:
+        try:
+            items = driver.execute_script(EXTRACT_REVIEWS_JS, only_new)
+        except Exception as e:
+            print(f"스크립트 추출 오류 → 기존 방식으로 재시도: {e}")
+    if items is not None:
+        return items
+
+    items = []
+    for b in find_review_blocks(driver):
+        try:
+            visit_date, visit_count = parse_visit_block(b)
+            items.append({"visit_date": visit_date, "visit_count": visit_count,
+                          "review_text": extract_review_text(b)})
+        except:
+            continue
+    return items
+
+import re, random, time
 from selenium.webdriver.common.by import By
 
 # 리뷰 정규화
@@ -253,15 +521,137 @@ def _normalize_count(v) -> str:
     return "" if v is None else str(v).strip()
 
 # 정규화 적용
-def _make_key(visit_date, visit_count, review_text) -> str:
+# key는 64비트 정수 (dedup.DigestSet에 저장)
+def _make_key(visit_date, visit_count, review_text) -> int:
     vd = _normalize_date(visit_date)
     vc = _normalize_count(visit_count)
     rt = _normalize_text(review_text)
     key_str = f"{vd}|{vc}|{rt}"
-    return hashlib.sha1(key_str.encode("utf-8")).hexdigest(), vd, vc, rt
+    return digest64(key_str), vd, vc, rt
+
+# 파싱된 리뷰 1건 → 중복 확인 후 emit(row)로 내보내기 (rows.append 또는 스트리밍 sink)
+# 반환: "new"(추가됨), "known"(이전 실행에서 이미 수집), "old"(since 이전), "dup"(이번 실행 중복), None(스킵)
+def _add_review(it, pname, seen, emit, known=(), since=None):
+    visit_date, visit_count, review_text = it["visit_date"], it["visit_count"], it["review_text"]
 
+    # 날짜/횟수 모두 None이면 스킵
+    if (visit_date is None) and (visit_count is None):
+        return None
+
+    # 3개의 변수 정규화 후 중복제거용 key 생성
+    key, vd_norm, vc_norm, rt_norm = _make_key(visit_date, visit_count, review_text)
+    if key in known:
+        return "known"
+    if key in seen:
+        return "dup"
+    # 기준일(since)보다 오래된 리뷰는 수집하지 않음
+    if since and vd_norm and vd_norm < since:
+        return "old"
+    seen.add(key)
+    emit({
+        "place_name": pname,
+        "visit_date": vd_norm,
+        "visit_count": (None if vc_norm == "" else int(vc_norm) if vc_norm.isdigit() else vc_norm),# 정규화된 방문횟수 가능하면 정수로 변환, 빈 문자열 → None
+        "review_text": rt_norm,
+    })
+    return "new"
+
+# 증분 수집용 상태 파일 (가게별 수집된 key 목록 + 가장 최근 방문일)
+def _state_path(state_dir, place_name):
+    return os.path.join(state_dir, f"{_safe_filename(place_name)}_state.json")
+
+def load_crawl_state(state_dir, place_name):
+    path = _state_path(state_dir, place_name)
+    if not os.path.exists(path):
+        return {"keys": [], "newest_visit_date": None}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+# extra: 함께 저장할 값 (ex. recrawl의 visitor_reviews)
+def save_crawl_state(state_dir, place_name, keys, newest_visit_date, **extra):
+    _write_json_atomic(_state_path(state_dir, place_name), {
+        "place_name": place_name,
+        "newest_visit_date": newest_visit_date,
+        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        **extra,
+        "keys": sorted(keys),
+    })
+
+# 임시 파일에 쓴 뒤 교체 → 저장 도중 죽어도 기존 파일은 유지
+def _write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+# 체크포인트 (수집된 rows, seen key, 라운드/스크롤 위치)
+def _checkpoint_path(checkpoint_dir, place_name):
+    return os.path.join(checkpoint_dir, f"{_safe_filename(place_name)}_checkpoint.json")
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"  체크포인트 읽기 실패 → 처음부터 수집: {e}")
+        return None
+
+# extra: n_rows, newest, out_path 등 재개에 필요한 값
+def save_checkpoint(path, place_name, round_i, scroll_y, seen, rows, **extra):
+    _write_json_atomic(path, {
+        "place_name": place_name,
+        "round": round_i,
+        "scroll_y": scroll_y,
+        "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "seen": list(seen),
+        "rows": rows,
+        **extra,
+    })
+
+# 저장된 스크롤 위치까지 빠르게 내려가기 (파싱/펼치기 없이 지연 로딩만 유도)
+def _restore_scroll(driver, target_y, max_stall=5):
+    stall, last_h = 0, 0
+    while stall < max_stall:
+        driver.execute_script(f"window.scrollTo(0, {target_y})")
+        human_delay(0.3, 0.5)
+        if (driver.execute_script("return window.scrollY;") or 0) >= target_y - 10:
+            return True
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+        human_delay(0.3, 0.5)
+        h = driver.execute_script("return document.body.scrollHeight;") or 0
+        stall = stall + 1 if h <= last_h else 0
+        last_h = h
+    return False
+
+
+# incremental=True: 이전 실행에서 저장한 key를 만나면(또는 since 이전 리뷰만 나오면) 스크롤을 멈추고 새 리뷰만 반환
+# since: "YYYY-MM-DD" 기준일, "last"면 상태 파일의 가장 최근 방문일 사용
+#        주의: 목록은 작성일(최신순) 기준이라 늦게 올라온 리뷰(방문일이 기준일 이전)는 "old"로 빠지고 다음 실행에서도 계속 빠짐
+#              → 빠짐없이 받아야 하면 since 없이 incremental만 사용 (이미 수집된 key를 만나면 멈춤)
+# checkpoint=True: checkpoint_rounds 라운드 또는 checkpoint_secs 초마다 중간 저장, 같은 가게 재실행 시 이어서 수집
+# sink: 새 리뷰를 바로 파일에 쓰는 CsvReviewSink → 메모리에 rows를 쌓지 않음 (반환 rows는 빈 리스트, 건수는 sink.count)
+# dom_wait=True: 스크롤 후 새 리뷰 노드가 붙을 때까지만 대기(최대 dom_wait_timeout초), 고정 딜레이는 politeness=(min, max)로만
+# dom_wait=False: 기존 랜덤 딜레이 방식
+# scan_new_only=True: 매 라운드 새로 붙은 리뷰 블록만 파싱 (처리한 <li>에 data-rv-done 표시)
+# js_expand=True: 펼쳐서 더보기를 expand_folds_js 1번 호출로 처리
+# extract="network": 화면 대신 리뷰 XHR 응답 JSON에서 추출 (make_driver(network_log=True) 필요)
+#                    처음 몇 라운드 동안 응답에서 리뷰를 못 찾으면 DOM 방식으로 전환
+# extract="webdriver": 스크립트 1번 추출 없이 블록마다 find_elements/.text로 파싱 (예전 방식, 비교 측정용)
+# telemetry: telemetry.CrawlTelemetry → 라운드별 시간/호출 수를 JSONL로 기록
+# adaptive_scroll=True: 라운드별 신규 건수로 스크롤 간격 조절 (AdaptiveScroll), False: 고정 간격 + 주기적 왕복 스크롤
+# prune_dom=True: 처리한 리뷰 노드를 매 라운드 DOM에서 제거 (리뷰 수만 건 가게에서 브라우저 메모리/조회 시간 유지)
+#                 scan_new_only + DOM 추출일 때만 동작, prune_keep개는 화면 주변에 남김
+def collect_reviews_full(driver, wait, hard_max=20000, incremental=False, since=None, state_dir=None,
+                         checkpoint=False, checkpoint_rounds=20, checkpoint_secs=60, checkpoint_dir=None,
+                         sink=None, dom_wait=True, dom_wait_timeout=1.5, politeness=None, scan_new_only=True,
+                         js_expand=True, extract="dom", telemetry=None, adaptive_scroll=True,
+                         prune_dom=False, prune_keep=30):
+    # 리뷰 탭/정렬 클릭 전에 시작해야 첫 목록 응답도 잡힘
+    capture = NetworkReviewCapture(driver) if extract == "network" else None
 
-def collect_reviews_full(driver, wait, hard_max=20000):
     ensure_entry_iframe(driver, wait)
     go_reviews_tab(driver, wait)
     
@@ -284,52 +674,149 @@ def collect_reviews_full(driver, wait, hard_max=20000):
         step = driver.execute_script("return Math.floor(window.innerHeight * 0.7);") or 700
     except:
         step = 700
+    scroller = AdaptiveScroll(step) if adaptive_scroll else None
 
     pname = place_title(driver)
-    seen, rows = set(), []
-    last_seen_total, idle_rounds = 0, 0
+    seen, rows = DigestSet(capacity=min(hard_max, 4096)), [] # 이번 실행에서 수집한 key (증분/마지막 점검 공용)
+    n_rows, newest = 0, None # 수집 건수, 가장 최근 방문일 (rows를 쌓지 않는 sink 모드에서도 추적)
+
+    def emit(row):
+        nonlocal n_rows, newest
+        n_rows += 1
+        if row["visit_date"] and (newest is None or row["visit_date"] > newest):
+            newest = row["visit_date"]
+        if sink is not None:
+            sink(row)
+        else:
+            rows.append(row)
+
+    # 증분 모드 → 이전 상태 불러오기
+    known, state = set(), None
+    if incremental:
+        state_dir = state_dir or os.path.join(BASE_DIR, "_state")
+        state = load_crawl_state(state_dir, pname)
+        known = DigestSet(state["keys"], capacity=2 * len(state["keys"]))
+        if since == "last":
+            since = state.get("newest_visit_date")
+        print(f"  증분 모드: 기존 {len(known)}건, since={since}")
+    elif since == "last":
+        since = None
+
+    # 체크포인트가 있으면 이어서 수집
+    ckpt_path, start_round, resume_y = None, 1, 0
+    if checkpoint:
+        checkpoint_dir = checkpoint_dir or os.path.join(BASE_DIR, "_checkpoint")
+        ckpt_path = _checkpoint_path(checkpoint_dir, pname)
+        ck = load_checkpoint(ckpt_path)
+        if ck:
+            # sink 모드: 출력 파일 자체가 기록 → 파일에 이미 쓴 리뷰 key로 seen 복원
+            if sink is not None:
+                seen = sink.open(pname, resume_path=ck.get("out_path"))
+                n_rows = sink.count
+            else:
+                seen, rows = DigestSet(ck["seen"], capacity=2 * len(ck["seen"])), ck["rows"]
+                n_rows = len(rows)
+            newest = ck.get("newest")
+            start_round, resume_y = ck["round"] + 1, ck["scroll_y"]
+            print(f"  체크포인트에서 재개: 라운드 {ck['round']}, {n_rows}건 ({ck['saved_at']})")
+    if sink is not None and sink.path is None:
+        sink.open(pname)
+    last_ckpt_round, last_ckpt_time = start_round - 1, time.time()
+
+    last_seen_total, idle_rounds = len(seen), 0
     scroll_direction = 1  # 1: 아래, -1: 위
+    n_nodes = 0 # 마지막으로 확인한 리뷰 노드 수 (dom_wait 기준값)
+
+    tm = telemetry or NULL_TELEMETRY
+
+    # 고정 대기 → dom_wait 모드에서는 politeness만큼만
+    def pause(lo, hi):
+        with tm.section("wait"):
+            if dom_wait:
+                polite_delay(politeness)
+            else:
+                human_delay(lo, hi)
+
+    # 새 리뷰 로딩 대기 → dom_wait 모드에서는 노드가 늘어나는 즉시 반환
+    def settle(lo, hi):
+        nonlocal n_nodes
+        with tm.section("wait"):
+            if dom_wait:
+                n_nodes = wait_for_new_reviews(driver, n_nodes, dom_wait_timeout)
+                polite_delay(politeness)
+            else:
+                human_delay(lo, hi)
+
+    # 이번 라운드에 새로 읽을 리뷰 (네트워크 응답 또는 DOM)
+    def read_items():
+        if capture is not None:
+            return capture.drain()
+        return read_review_blocks(driver, only_new=scan_new_only, js=extract != "webdriver")
+
+    # "펼쳐서 더보기"는 다음 목록을 불러오는 버튼 → network 모드에서도 눌러야 새 응답이 옴 (파싱만 생략)
+    def expand():
+        with tm.section("expand"):
+            if js_expand and expand_folds_js(driver) is not None:
+                return
+            click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=politeness if dom_wait else (0.12, 0.25))
 
     driver.execute_script("window.scrollTo(0,0)")
     human_delay(0.6, 1.0)
+    if resume_y:
+        _restore_scroll(driver, resume_y)
+    if dom_wait:
+        n_nodes = driver.execute_script(REVIEW_COUNT_JS) or 0
 
-    for round_i in range(1, 9999):
+    t_loop, n_rounds = time.time(), 0
+    for round_i in range(start_round, 9999):
+        n_rounds += 1
+        tm.start_round(round_i)
         ensure_entry_iframe(driver, wait)
-        click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25)) # 펼쳐서 더보기 모두 누르기
+        expand() # 펼쳐서 더보기 모두 누르기
 
-        # <li> 블록들 수집
-        blocks = find_review_blocks(driver)
-      
-        for b in blocks:
-            try:
-                # 방문일/방문횟수 파싱
-                visit_date, visit_count = parse_visit_block(b)
-                # 본문 텍스트 파싱
-                review_text = extract_review_text(b)
+        # <li> 블록들 수집 + 방문일/방문횟수/본문 파싱 (한 번의 스크립트 호출)
+        with tm.section("parse"):
+            items = read_items()
 
-                # 날짜/횟수 모두 None이면 스킵
-                if (visit_date is None) and (visit_count is None):
+            round_new = round_stop = 0
+            for it in items:
+                try:
+                    status = _add_review(it, pname, seen, emit, known, since)
+                except:
                     continue
+                if status == "new":
+                    round_new += 1
+                elif status in ("known", "old"):
+                    round_stop += 1
+        tm.note(blocks=len(items), new_rows=round_new, total_rows=n_rows, idle_rounds=idle_rounds)
 
-                # 3개의 변수 정규화 후 중복제거용 key 생성
-                key, vd_norm, vc_norm, rt_norm = _make_key(visit_date, visit_count, review_text)
-                if key in seen:
-                    continue
-                seen.add(key)
-                rows.append({
-                    "place_name": pname,
-                    "visit_date": vd_norm,
-                    "visit_count": (None if vc_norm == "" else int(vc_norm) if vc_norm.isdigit() else vc_norm),# 정규화된 방문횟수 가능하면 정수로 변환, 빈 문자열 → None
-                    "review_text": rt_norm,
-                })
-            except:
-                continue
+        # 처리한 노드 정리 (data-rv-done은 DOM 추출 + scan_new_only일 때만 붙음)
+        if prune_dom and scan_new_only and capture is None:
+            tm.note(pruned=prune_reviews(driver, prune_keep))
 
         if round_i % 5 == 0:
-            print(f"  라운드 {round_i}: 현재 {len(rows)}건 수집됨")
+            print(f"  라운드 {round_i}: 현재 {n_rows}건 수집됨")
+
+        # 주기적으로 체크포인트 저장
+        if ckpt_path and (round_i - last_ckpt_round >= checkpoint_rounds or time.time() - last_ckpt_time >= checkpoint_secs):
+            save_checkpoint(ckpt_path, pname, round_i, driver.execute_script("return window.scrollY;") or 0,
+                            seen if sink is None else [], rows,
+                            n_rows=n_rows, newest=newest, out_path=sink.path if sink is not None else None)
+            last_ckpt_round, last_ckpt_time = round_i, time.time()
 
         # 최대 수집 한도에 도달시 종료
-        if len(rows) >= hard_max:
+        if n_rows >= hard_max:
+            break
+
+        # 네트워크 응답에서 리뷰를 못 찾는 경우 (응답 구조 변경 등) → DOM 방식으로 전환
+        if capture is not None and round_i >= start_round + 2 and capture.responses == 0:
+            print("  네트워크 응답에서 리뷰를 찾지 못함 → DOM 추출로 전환")
+            capture = None
+            continue
+
+        # 최신순 정렬이므로 새 리뷰 없이 기존/기준일 이전 리뷰만 보이면 더 내려갈 필요 없음
+        if (known or since) and round_new == 0 and round_stop > 0:
+            print(f"  이미 수집된 지점 도달 → 중단 (라운드 {round_i}, 신규 {n_rows}건)")
             break
         # 새로 추가된 key 확인
         if len(seen) == last_seen_total:
@@ -337,132 +824,243 @@ def collect_reviews_full(driver, wait, hard_max=20000):
         else:
             idle_rounds = 0
             last_seen_total = len(seen)
+        tm.note(idle_rounds=idle_rounds)
+
+        # 다음 이동 결정 (적응형: 신규 건수 기준)
+        move = "step"
+        if scroller is not None:
+            move = scroller.next_move(round_new, driver.execute_script(SCROLL_POS_JS))
+            tm.note(step=scroller.step, move=move)
 
         # idle 보강 시퀀스
-        # 15 라운드 연속으로 새 리뷰가 추가되지 않았을 때 
-        if idle_rounds >= 15:
+        # 15 라운드 연속으로 새 리뷰가 추가되지 않았을 때 (적응형은 scroller.recover_after 라운드)
+        if idle_rounds >= 15 or (scroller is not None and scroller.should_recover()):
             print(f"  추가 확인 중... (idle={idle_rounds})")
 
             # 스크롤 제일 밑으로 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-            human_delay(0.6, 1.0)
-            click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25))
-            human_delay(0.4, 0.7)
+            settle(0.6, 1.0)
+            expand()
+            pause(0.4, 0.7)
 
             # 다시 위로 올라감 (상하단 모두 점검)
             driver.execute_script("window.scrollTo(0, 0)")
-            human_delay(0.6, 1.0)
-            click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25))
+            pause(0.6, 1.0)
+            expand()
 
             for scroll_pos in [0.25, 0.5, 0.75]:
                 driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {scroll_pos})")
-                human_delay(0.4, 0.7)
-                click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25))
+                pause(0.4, 0.7)
+                expand()
 
             # 지금 화면에서 보이는 리뷰들 가져와서 중복 확인
-            blocks_check = find_review_blocks(driver)
+            items_check = read_items()
             new_found = 0
 
             # 새로운 리뷰가 발생했다면 다시 점검
             # 정규화, key생성, 기존 리뷰들과 비교
-            for b in blocks_check:
+            for it in items_check:
                 try:
-                    visit_date, visit_count = parse_visit_block(b)
-                    review_text = extract_review_text(b)
-                    if (visit_date is None) and (visit_count is None):
-                        continue
-
-                    key, vd_norm, vc_norm, rt_norm = _make_key(visit_date, visit_count, review_text)
-                    if key not in seen:
+                    if _add_review(it, pname, seen, emit, known, since) == "new":
                         new_found += 1
-                        seen.add(key)
-                        rows.append({
-                            "place_name": pname,
-                            "visit_date": vd_norm,
-                            "visit_count": (None if vc_norm == "" else int(vc_norm) if vc_norm.isdigit() else vc_norm),
-                            "review_text": rt_norm,
-                        })
                 except:
                     continue
 
             if new_found == 0:
-                print(f" 최종: {len(rows)}건")
+                print(f" 최종: {n_rows}건")
                 break
             idle_rounds = 0
+            if scroller is not None:
+                scroller.reset()
+
+        if scroller is not None:
+            # 목록이 끝에서만 늘어나는 중 → 위쪽 재확인 없이 맨 아래로
+            if move == "bottom":
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+            else:
+                small_bounce_scroll(driver, px=scroller.step, jitter=100, sleep_range=None)
+            settle(0.4, 0.7)
+            continue
 
         # 왕복/바운스 스크롤
         if round_i % 15 == 0:
             scroll_direction *= -1
             driver.execute_script(f"window.scrollBy(0, {scroll_direction * 800})")
-            human_delay(0.3, 0.6)
+            pause(0.3, 0.6)
 
-        small_bounce_scroll(driver, px=step, jitter=100, sleep_range=(0.4, 0.7))
+        small_bounce_scroll(driver, px=step, jitter=100, sleep_range=None)
+        settle(0.4, 0.7)
 
         if round_i % 8 == 0:
             driver.execute_script("window.scrollBy(0, -500)")
-            human_delay(0.3, 0.6)
-            small_bounce_검
+            pause(0.3, 0.6)
+            small_bounce_scroll(driver, px=step, jitter=100, sleep_range=None)
+            settle(0.4, 0.7)
+
+    tm.finish_round()
+
+    # 마지막 점검
     driver.execute_script("window.scrollTo(0,0)")
-    human_delay(0.6, 1.0)
-    click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25))
-    human_delay(0.4, 0.7)
+    pause(0.6, 1.0)
+    expand()
+    pause(0.4, 0.7)
 
     for _ in range(3):
         driver.execute_script("window.scrollBy(0, 800)")
-        human_delay(0.3, 0.6)
-        click_fold_expand_all(driver, wait, max_clicks=999, sleep_range=(0.12, 0.25))
+        pause(0.3, 0.6)
+        expand()
 
-    blocks = find_review_blocks(driver)
-    for b in blocks:
+    items = read_items()
+    for it in items:
         try:
-            visit_date, visit_count = parse_visit_block(b)
-            review_text = extract_review_text(b)
-            if (visit_date is None) and (visit_count is None):
-                continue
-
-            key, vd_norm, vc_norm, rt_norm = _make_key(visit_date, visit_count, review_text)
-            if key in seen:
-                continue
-            seen.add(key)
-            rows.append({
-                "place_name": pname,
-                "visit_date": vd_norm,
-                "visit_count": (None if vc_norm == "" else int(vc_norm) if vc_norm.isdigit() else vc_norm),
-                "review_text": rt_norm,
-            })
+            _add_review(it, pname, seen, emit, known, since)
         except:
             continue
 
-    print(f"  최종 수집 완료: {len(rows)}건")
+    print(f"  최종 수집 완료: {n_rows}건")
+    if n_rounds:
+        print(f"  스크롤 라운드 {n_rounds}회, 평균 {(time.time() - t_loop) / n_rounds:.2f}초/라운드")
 
-    # (선택) 마지막 방어적 중복 제거
-    final_seen, deduped = set(), []
-    for r in rows:
-        k = f"{_normalize_date(r['visit_date'])}|{_normalize_count(r['visit_count'])}|{_normalize_text(r['review_text'])}"
-        if k in final_seen:
-            continue
-        final_seen.add(k)
-        deduped.append(r)
+    # 증분 모드 → 상태 갱신 (기존 key + 이번에 새로 수집한 key)
+    if incremental:
+        dates = [d for d in (newest, state.get("newest_visit_date")) if d]
+        save_crawl_state(state_dir, pname, known | seen, max(dates) if dates else None,
+                         visitor_reviews=state.get("visitor_reviews"))
 
-    return deduped
+    # 정상 종료 → 체크포인트 삭제
+    if ckpt_path and os.path.exists(ckpt_path):
+        os.remove(ckpt_path)
 
+    return rows
 
 
-# 데이터 csv로 저장
-def save_visits_csv(rows, base_dir, place_name):
-    if not rows:
-        return None
-      
-    # 파일 이름/경로 지정
-    safe = re.sub(r'[\\/:*?"<>|]+', '_', place_name).strip()
-    out_path = os.path.join(base_dir, f"{safe}_new_reviews.csv") 
-    with open(out_path, "w", newline="", encoding="utf-8-sig") as f:
-        w = csv.writer(f)
-        w.writerow(["place_name", "visit_date", "visit_count", "review_text"])
-        for r in rows:
-            w.writerow([r["place_name"], r["visit_date"], r["visit_count"], r["review_text"]])
-    print(f"✔ 저장: {out_path}")
-    return out_path
+
+# 파일명에 쓸 수 없는 문자 치환
+def _safe_filename(place_name):
+    return re.sub(r'[\\/:*?"<>|]+', '_', place_name).strip()
+
+# 리뷰를 수집되는 즉시 CSV에 한 줄씩 추가 (메모리에 쌓지 않음, 수집 중에도 파일을 tail 가능)
+# suffix: 증분 수집처럼 기존 파일을 덮어쓰면 안 될 때 파일명 뒤에 붙임 (ex. _new_reviews_20250101_120000.csv)
+class CsvReviewSink:
+    COLUMNS = ["place_name", "visit_date", "visit_count", "review_text"]
+
+    def __init__(self, base_dir, suffix=""):
+        self.base_dir, self.suffix = base_dir, suffix
+        self.path, self.count = None, 0
+        self._f = self._w = None
+
+    # 가게명이 정해진 뒤 파일 열기
+    # resume_path가 있으면 이어쓰기 + 이미 저장된 리뷰 key 반환 (체크포인트 재개용)
+    # resume_path가 다른 폴더(이전 실행의 결과 폴더 등)에 있으면 base_dir로 복사한 뒤 이어씀 → 결과는 항상 base_dir에
+    def open(self, place_name, resume_path=None):
+        keys = DigestSet()
+        if resume_path and os.path.exists(resume_path):
+            if os.path.abspath(os.path.dirname(resume_path)) != os.path.abspath(self.base_dir):
+                dst = os.path.join(self.base_dir, os.path.basename(resume_path))
+                shutil.copyfile(resume_path, dst)
+                print(f"  이전 부분 결과 복사: {resume_path} → {dst}")
+                resume_path = dst
+            self.path = resume_path
+            with open(resume_path, newline="", encoding="utf-8-sig") as f:
+                for r in csv.DictReader(f):
+                    keys.add(_make_key(r["visit_date"], r["visit_count"], r["review_text"])[0])
+            self.count = len(keys)
+            self._f = open(self.path, "a", newline="", encoding="utf-8-sig")
+            self._w = csv.writer(self._f)
+        else:
+            self.path = os.path.join(self.base_dir, f"{_safe_filename(place_name)}_new_reviews{self.suffix}.csv")
+            self._f = open(self.path, "w", newline="", encoding="utf-8-sig")
+            self._w = csv.writer(self._f)
+            self._w.writerow(self.COLUMNS)
+            self._f.flush()
+        return keys
+
+    def __call__(self, row):
+        self._w.writerow([row[c] for c in self.COLUMNS])
+        self._f.flush()
+        self.count += 1
+
+    # 한 건도 없으면 빈 파일은 지움 (0건이면 결과 파일 없음)
+    def close(self):
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+        if self.count == 0:
+            os.remove(self.path)
+        else:
+            print(f"✔ 저장: {self.path}")
+
+
+# 가게 1곳 수집 → 저장 (드라이버는 호출하는 쪽에서 관리)
+# opts: collect_reviews_full 옵션 (incremental, since, checkpoint ...)
+# 수집되는 즉시 CSV에 추가하고 건수 반환
+# telemetry_path: 라운드별 기록(JSONL) 파일, None이면 기록 안 함
+def crawl_store(driver, wait, nm, hard_max=20000, telemetry_path=None, **opts):
+    t0 = time.time()
+    open_entry_cached(driver, wait, nm, open_entry_by_search) # 캐시에 있으면 검색 생략
+    t_open = time.time() - t0
+
+    # 증분 수집은 새로 늘어난 리뷰만 별도 파일로 저장
+    suffix = f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}" if opts.get("incremental") else ""
+    sink = CsvReviewSink(BASE_DIR, suffix=suffix)
+    tm = CrawlTelemetry(telemetry_path, nm, driver) if telemetry_path else None
+    try:
+        collect_reviews_full(driver, wait, hard_max=hard_max, sink=sink, telemetry=tm, **opts)
+    finally:
+        sink.close()
+        if tm:
+            print_summary(tm.summary(sink.count))
+
+    if sink.count:
+        print(f"[{nm}] 총 {sink.count}건 수집 완료")
+    else:
+        print(f"[{nm}] 수집 결과 0건")
+    # 프로필별 비교용 소요 시간
+    print(f"[{nm}] 검색/진입 {t_open:.1f}초, 리뷰 수집 {time.time() - t0 - t_open:.1f}초")
+    return sink.count
+
+# 워커 1개: 브라우저 세션을 한 번만 띄우고 큐에서 가게를 하나씩 꺼내 수집
+# 크롬 프로필 폴더는 동시에 하나의 브라우저만 쓸 수 있으므로 워커마다 따로 둠
+def _crawl_worker(worker_id, jobs, results, lock, hard_max, profile, opts):
+    session = BrowserSession(profile, network_log=opts.get("extract") == "network",
+                             user_data_dir=f"{USER_DATA_DIR}_w{worker_id}")
+    with session: # 워커마다 자기 WebDriverWait (session.wait)
+        while True:
+            try:
+                nm = jobs.get_nowait()
+            except queue.Empty:
+                break
+            print(f"\n [w{worker_id}] {nm} 수집 시작 ")
+            failed = False
+            try:
+                n = crawl_store(session.driver, session.wait, nm, hard_max=hard_max, **opts)
+            except Exception as e:
+                print(f" [w{worker_id}] 실패: {nm} → {e}")
+                PLACE_CACHE.invalidate(nm) # 엉뚱한 가게로 들어갔을 수 있으니 다음엔 다시 검색
+                n, failed = 0, True
+            with lock:
+                results[nm] = n
+            session.store_done(failed)
+
+# 여러 가게 동시 수집
+# 브라우저 N개(workers)가 큐에서 가게를 나눠 가져가므로 전체 시간은 가게 수가 아니라 워커 수에 비례
+def crawl_stores_parallel(store_names, workers=4, hard_max=20000, profile="default", **opts):
+    jobs = queue.Queue()
+    for nm in store_names:
+        jobs.put(nm)
+
+    results, lock = {}, threading.Lock()
+    workers = max(1, min(workers, len(store_names)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_crawl_worker, i, jobs, results, lock, hard_max, profile, opts) for i in range(1, workers + 1)]
+        for f in futures:
+            f.result()
+
+    # 입력 순서대로 가게별 수집 건수 정리 (리뷰 본문은 각 CSV에 이미 저장됨)
+    counts = {nm: results.get(nm, 0) for nm in store_names}
+    print(f"\n전체 {len(store_names)}곳 / {sum(counts.values())}건 수집 완료 (workers={workers})")
+    return counts
 
 # 실행 & 디버깅
 names = [
@@ -476,21 +1074,37 @@ names = [
     "갈비둥지"
 ]
 
-for nm in names:
-    print(f"\n {nm} 수집 시작 ")
-    driver = None
-    try:
-        driver = make_driver()
-        wait = WebDriverWait(driver, 10)
-        open_entry_by_search(driver, wait, nm)
-        rows = collect_reviews_full(driver, wait, hard_max=20000)
-        if rows:
-            save_visits_csv(rows, BASE_DIR, rows[0]["place_name"])
-            print(f"총 {len(rows)}건 수집 완료")
-        else:
-            print("수집 결과 0건")
-    except Exception as e:
-        print(f" 실패: {nm} → {e}")
-    finally:
-        if driver:
-            driver.quit()
+WORKERS = 1 # 동시에 띄울 브라우저 수 (1이면 기존처럼 한 곳씩 순차 수집)
+DRIVER_PROFILE = "default" # "headless", "lean" (DRIVER_PROFILES 참고)
+INCREMENTAL = False # True: 지난 실행 이후 새로 달린 리뷰만 수집
+SINCE = None # 증분 수집 기준일 "YYYY-MM-DD" (또는 "last": 지난 실행의 가장 최근 방문일)
+CHECKPOINT = True # 중간 저장 → 브라우저가 죽어도 다음 실행에서 이어서 수집
+DOM_WAIT = True # 고정 sleep 대신 새 리뷰가 로딩되는 즉시 다음 라운드 진행
+POLITENESS = None # DOM_WAIT 모드에서 추가로 쉴 랜덤 지연 (min, max) 초, ex) (0.2, 0.5)
+EXTRACT = "dom" # "network": 리뷰 XHR 응답 JSON에서 바로 추출
+PRUNE_DOM = False # True: 처리한 리뷰 노드를 DOM에서 제거 (리뷰 수만 건 가게용)
+
+USER_DATA_DIR = os.path.join(BASE_DIR, "_chrome_profile") # 캐시/쿠키 유지용 크롬 프로필
+# 라운드별 기록 → python telemetry.py <파일> 로 가게별 요약
+TELEMETRY_PATH = os.path.join(BASE_DIR, "_telemetry", f"crawl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+CRAWL_OPTS = dict(incremental=INCREMENTAL, since=SINCE, checkpoint=CHECKPOINT,
+                  dom_wait=DOM_WAIT, politeness=POLITENESS, extract=EXTRACT,
+                  prune_dom=PRUNE_DOM, telemetry_path=TELEMETRY_PATH)
+
+if __name__ == "__main__":
+    if WORKERS > 1:
+        crawl_stores_parallel(names, workers=WORKERS, hard_max=20000, profile=DRIVER_PROFILE, **CRAWL_OPTS)
+    else:
+        # 브라우저 1개를 모든 가게에 재사용 (N곳마다 또는 메모리 초과 시 재시작)
+        with BrowserSession(DRIVER_PROFILE, network_log=EXTRACT == "network", user_data_dir=USER_DATA_DIR) as session:
+            for nm in names:
+                print(f"\n {nm} 수집 시작 ")
+                failed = False
+                try:
+                    crawl_store(session.driver, session.wait, nm, hard_max=20000, **CRAWL_OPTS)
+                except Exception as e:
+                    print(f" 실패: {nm} → {e}")
+                    PLACE_CACHE.invalidate(nm)
+                    failed = True
+                session.store_done(failed)
@@ -0,0 +1,201 @@
+import os, json, time
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    import psutil # 있으면 크롬 프로세스 전체 메모리로 재시작 판단
+except ImportError:
+    psutil = None
+
+# 드라이버 프로필
+# default : 기존 설정 (화면 최대화, 모든 리소스 로딩)
+# headless: 창 없이 실행, 고정 뷰포트
+# lean    : headless + 이미지/폰트/미디어/지도 타일 차단, 지도 캔버스(WebGL) 비활성화, 작은 뷰포트 → 리뷰 텍스트만 필요할 때
+DRIVER_PROFILES = {
+    "default":  dict(headless=False, block_resources=False, window_size=None),
+    "headless": dict(headless=True,  block_resources=False, window_size=(1280, 1000)),
+    "lean":     dict(headless=True,  block_resources=True,  window_size=(800, 1000)),
+}
+
+# lean 프로필에서 요청 자체를 막을 URL 패턴 (CDP Network.setBlockedURLs)
+# 패턴은 URL 전체와 비교 → 확장자 뒤에 쿼리가 붙는 주소(pstatic 썸네일 ...jpg?type=w560 등)도 막도록 "?*" 패턴을 함께 등록
+BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",  # 이미지
+    "woff", "woff2", "ttf", "otf",                      # 폰트
+    "mp4", "webm", "m3u8", "mp3",                       # 미디어
+]
+BLOCKED_URL_PATTERNS = [p for ext in BLOCKED_EXTENSIONS for p in (f"*.{ext}", f"*.{ext}?*")] + [
+    "*map.pstatic.net*", "*nrbe.map.naver.net*",        # 지도 타일
+    "*phinf.pstatic.net*", "*search.pstatic.net/common/?*", # 사진 서버 / 이미지 리사이즈 프록시 (주소에 확장자가 없거나 쿼리 안에 있음)
+]
+
+# 드라이버 설정 및 새 chrome 브라우저 실행
+# profile: DRIVER_PROFILES 이름
+# network_log=True: 네트워크 응답 수집용 performance 로그 활성화 (collect_reviews_full(extract="network"))
+# user_data_dir: 크롬 프로필 폴더 → 쿠키/캐시가 실행 간에 유지됨 (동시에 한 브라우저만 사용 가능)
+def make_driver(profile="default", network_log=False, user_data_dir=None):
+    prof = DRIVER_PROFILES[profile]
+    opts = webdriver.ChromeOptions() # 크롬 실행 옵션 생성
+    opts.add_argument("--disable-gpu") # gpu 비활성화 → 서버 등에서 렌더링 이슈 방지 
+    opts.add_argument("--no-sandbox") # 샌드박스 모드 비활성화 → 권한 문제 방지
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        opts.add_argument(f"--user-data-dir={user_data_dir}") # 정적 리소스 캐시 재사용
+    if prof["headless"]:
+        opts.add_argument("--headless=new") # 창 없이 실행
+    if prof["window_size"]:
+        opts.add_argument("--window-size={},{}".format(*prof["window_size"])) # 고정 뷰포트
+    else:
+        opts.add_argument("--start-maximized") # 브라우저 최대화 실행
+    if prof["block_resources"]:
+        opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2}) # 이미지 로딩 안 함
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_argument("--disable-remote-fonts") # 웹폰트 다운로드 안 함
+        opts.add_argument("--disable-3d-apis") # WebGL 끔 → 지도 캔버스 렌더링 생략
+        opts.add_argument("--autoplay-policy=user-gesture-required") # 동영상 자동재생 안 함
+    opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36") # User-Agent 설정 → 크롤링 차단 방지용
+    if network_log:
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"}) # Network.* 이벤트 기록
+    
+    driver = webdriver.Chrome(options=opts) # 위 설정으로 새 Chrome 브라우저 실행
+    if prof["block_resources"]:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"리소스 차단 설정 실패 (무시하고 진행): {e}")
+    return driver
+
+# 차단 패턴 확인: 실제 페이지를 열어 performance 로그에서 받아진/막힌 이미지·폰트·미디어 요청 수를 셈
+# 반환: {"loaded": {리소스 종류: 건수}, "blocked": 건수, "samples": 받아진 주소 일부} → loaded가 비어 있어야 정상
+def check_blocking(url, profile="lean", wait_sec=5):
+    driver = make_driver(profile, network_log=True)
+    try:
+        driver.get(url)
+        time.sleep(wait_sec)
+        loaded, blocked, samples = {}, 0, []
+        for entry in driver.get_log("performance"):
+            try:
+                msg = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            params = msg.get("params", {})
+            if msg.get("method") == "Network.responseReceived" and params.get("type") in ("Image", "Font", "Media"):
+                loaded[params["type"]] = loaded.get(params["type"], 0) + 1
+                if len(samples) < 10:
+                    samples.append(params["response"]["url"])
+            elif msg.get("method") == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked += 1
+        return {"loaded": loaded, "blocked": blocked, "samples": samples}
+    finally:
+        driver.quit()
+
+# 기본 크롬 프로필 폴더 (캐시 유지용)
+DEFAULT_USER_DATA_DIR = os.path.join(os.path.expanduser("~"), ".naver_crawl_chrome")
+
+# 브라우저 세션: 드라이버 1개를 여러 가게/수집기에서 계속 재사용
+# 가게마다 크롬을 새로 띄우지 않고, max_stores곳 수집 후 또는 메모리가 max_rss_mb를 넘으면 재시작
+#
+# with BrowserSession("lean") as session:
+#     for nm in names:
+#         crawl_store(session.driver, session.wait, nm)
+#         session.store_done()
+#
+# limiter: ratelimit.RateLimiter → 여러 세션이 공유하면 전체 이동/클릭 속도가 함께 제한됨
+# lazy=True: with 진입 시 바로 띄우지 않고 처음 필요할 때 start() (HTTP 수집이 대부분 성공하면 크롬을 안 띄움)
+class BrowserSession:
+    def __init__(self, profile="default", network_log=False, user_data_dir=DEFAULT_USER_DATA_DIR,
+                 max_stores=20, max_rss_mb=1500, timeout=10, warm_url="https://map.naver.com/", limiter=None,
+                 lazy=False):
+        self.profile, self.network_log, self.user_data_dir = profile, network_log, user_data_dir
+        self.limiter, self.lazy = limiter, lazy
+        self.max_stores, self.max_rss_mb, self.timeout = max_stores, max_rss_mb, timeout
+        self.warm_url = warm_url
+        self.driver = self.wait = None
+        self.stores = 0   # 현재 브라우저로 처리한 가게 수
+        self.restarts = 0
+
+    def __enter__(self):
+        if not self.lazy:
+            self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        if self.driver is not None:
+            return self
+        t0 = time.time()
+        self.driver = make_driver(self.profile, network_log=self.network_log, user_data_dir=self.user_data_dir)
+        self.wait = WebDriverWait(self.driver, self.timeout)
+        self.stores = 0
+        if self.limiter is not None:
+            self.limiter.install(self.driver)
+        # 첫 페이지를 미리 열어 두면 이후 가게 진입 시 정적 리소스는 캐시에서 로딩
+        if self.warm_url:
+            try:
+                self.driver.get(self.warm_url)
+            except Exception as e:
+                print(f"워밍업 실패 (무시): {e}")
+        print(f"브라우저 시작 ({self.profile}, {time.time() - t0:.1f}초)")
+        return self
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = self.wait = None
+
+    def recycle(self, reason=""):
+        print(f"브라우저 재시작: {reason}")
+        self.close()
+        self.restarts += 1
+        self.start()
+
+    # 크롬 메모리 사용량 (MB)
+    # psutil이 있으면 chromedriver 하위 프로세스 RSS 합계, 없으면 현재 페이지 JS 힙 크기로 근사
+    def rss_mb(self):
+        if self.driver is None:
+            return 0.0
+        if psutil is not None:
+            try:
+                root = psutil.Process(self.driver.service.process.pid)
+                procs = [root] + root.children(recursive=True)
+                return sum(p.memory_info().rss for p in procs if p.is_running()) / 1024 / 1024
+            except Exception:
+                pass
+        try:
+            return (self.driver.execute_script(
+                "return (performance.memory && performance.memory.usedJSHeapSize) || 0;") or 0) / 1024 / 1024
+        except Exception:
+            return 0.0
+
+    # 가게 1곳 처리가 끝날 때마다 호출 → 필요하면 재시작
+    # 크롬이 죽었으면(failed=True) 바로 재시작
+    def store_done(self, failed=False):
+        if self.driver is None: # lazy 세션에서 아직 브라우저를 쓰지 않음
+            return
+        self.stores += 1
+        if failed and not self.alive():
+            self.recycle("응답 없음")
+        elif self.stores >= self.max_stores:
+            self.recycle(f"{self.stores}곳 처리")
+        else:
+            rss = self.rss_mb()
+            if rss > self.max_rss_mb:
+                self.recycle(f"메모리 {rss:.0f}MB")
+
+    def alive(self):
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+# lean 프로필로 실제 검색 페이지를 열어 차단 패턴 확인
+if __name__ == "__main__":
+    from urllib.parse import quote
+    print(check_blocking(f"https://map.naver.com/p/search/{quote('와우 솥뚜껑삼겹살')}"))
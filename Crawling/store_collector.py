@@ -0,0 +1,116 @@
+import os, time
+import pandas as pd
+from datetime import datetime
+
+import review_date_count as rdc
+from basic_info import _extract_home_basic
+from menu import collect_menus
+from keyword_reviews import place_title, collect_keywords_current_page
+from place_cache import PLACE_CACHE, open_entry_cached
+from session import BrowserSession
+from history import HistoryStore, now_str
+
+# 가게 1곳을 한 번만 열어서 기본정보 / 메뉴 / 키워드 / 리뷰를 모두 수집
+# 기존에는 basic_info, menu, keyword_reviews, review_date_count가 각각 검색 → iframe 전환 → 로딩을 반복 (가게당 4번)
+# 여기서는 상세페이지 진입 1번 후 홈 → 메뉴 탭 → 리뷰 탭(키워드 → 리뷰 목록) 순서로 탭만 전환
+
+BASE_DIR = rdc.BASE_DIR # 결과 폴더는 review_date_count와 같은 곳
+
+# 한 가게의 네 가지 결과를 같은 폴더에 저장
+# 반환: {"home": dict, "menus": [...], "keywords": [...], "reviews": 건수, "errors": {단계: 메시지}}
+# review_opts: collect_reviews_full 옵션 (incremental, since, dom_wait ...)
+def crawl_store_all(session, name, out_dir, hard_max=20000, **review_opts):
+    driver, wait = session.driver, session.wait
+    t0 = time.time()
+    open_entry_cached(driver, wait, name, rdc.open_entry_by_search)
+    t_open = time.time() - t0
+
+    result = {"home": None, "menus": [], "keywords": [], "reviews": 0, "errors": {}}
+    place_name = name
+
+    # 홈 탭 (진입 직후 기본 탭)
+    try:
+        result["home"] = _extract_home_basic(driver, wait)
+        place_name = result["home"].get("name") or place_title(driver) or name
+    except Exception as e:
+        result["errors"]["home"] = str(e)
+
+    # 메뉴 탭
+    try:
+        result["menus"] = collect_menus(driver, wait, max_rounds=6)
+    except Exception as e:
+        result["errors"]["menus"] = str(e)
+
+    # 리뷰 탭 상단 키워드 (리뷰 탭으로 이동하므로 리뷰 목록 수집 전에)
+    try:
+        result["keywords"] = collect_keywords_current_page(driver, wait)
+    except Exception as e:
+        result["errors"]["keywords"] = str(e)
+
+    # 홈/메뉴/키워드는 리뷰 수집 전에 먼저 저장 (리뷰 수집 중 실패해도 남도록)
+    safe = rdc._safe_filename(place_name)
+    if result["home"]:
+        pd.DataFrame([{"query": name, **result["home"]}]).to_csv(
+            os.path.join(out_dir, f"{safe}_home.csv"), index=False, encoding="utf-8-sig")
+    if result["menus"]:
+        df = pd.DataFrame(result["menus"]); df.insert(0, "place_name", place_name)
+        df.to_csv(os.path.join(out_dir, f"{safe}_menus.csv"), index=False, encoding="utf-8-sig")
+    if result["keywords"]:
+        df = pd.DataFrame(result["keywords"], columns=["label", "count"]); df.insert(0, "place_name", place_name)
+        df.to_csv(os.path.join(out_dir, f"{safe}_keywords.csv"), index=False, encoding="utf-8-sig")
+
+    # 리뷰 목록 (CSV에 바로 추가)
+    # 체크포인트로 재개하면 이전 실행 폴더의 부분 파일을 out_dir로 복사해서 이어씀 (CsvReviewSink.open)
+    t1 = time.time()
+    sink = rdc.CsvReviewSink(out_dir)
+    try:
+        rdc.collect_reviews_full(driver, wait, hard_max=hard_max, sink=sink, **review_opts)
+    except Exception as e:
+        result["errors"]["reviews"] = str(e)
+    finally:
+        sink.close()
+    result["reviews"] = sink.count
+
+    print(f"[{name}] 진입 {t_open:.1f}초, 홈/메뉴/키워드 {t1 - t0 - t_open:.1f}초, 리뷰 {time.time() - t1:.1f}초"
+          f" | 메뉴 {len(result['menus'])}개, 키워드 {len(result['keywords'])}개, 리뷰 {sink.count}건")
+    for step, msg in result["errors"].items():
+        print(f"  {step} 실패: {msg}")
+    return result
+
+names = rdc.names
+
+DRIVER_PROFILE = "default"
+REVIEW_OPTS = dict(dom_wait=True, checkpoint=True)
+
+if __name__ == "__main__":
+    out_dir = os.path.join(BASE_DIR, f"stores_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    homes, keywords = [], []
+    snapshot_at = now_str()
+    with BrowserSession(DRIVER_PROFILE, user_data_dir=rdc.USER_DATA_DIR) as session, HistoryStore() as history:
+        for nm in names:
+            print(f"\n {nm} 수집 시작 ")
+            failed = False
+            try:
+                res = crawl_store_all(session, nm, out_dir, **REVIEW_OPTS)
+                if res["home"]:
+                    homes.append({"query": nm, **res["home"]})
+                    history.add_home(nm, res["home"], snapshot_at)
+                if res["keywords"]:
+                    history.add_keywords(nm, res["keywords"], snapshot_at)
+                pname = (res["home"] or {}).get("name") or nm
+                keywords.extend({"place_name": pname, "label": l, "count": c} for l, c in res["keywords"])
+                failed = bool(res["errors"])
+            except Exception as e:
+                print(f" 실패: {nm} → {e}")
+                PLACE_CACHE.invalidate(nm)
+                failed = True
+            session.store_done(failed)
+
+    # 경쟁가게 비교용 통합 파일 (basic_info / keyword_reviews 실행 결과와 같은 형식)
+    if homes:
+        pd.DataFrame(homes).to_csv(os.path.join(out_dir, "competitors_home_basic.csv"), index=False, encoding="utf-8-sig")
+    if keywords:
+        pd.DataFrame(keywords).to_csv(os.path.join(out_dir, "competitors_keywords.csv"), index=False, encoding="utf-8-sig")
+    print("저장:", out_dir)
@@ -0,0 +1,171 @@
+import os, json, time, threading
+from contextlib import contextmanager, nullcontext
+from collections import defaultdict
+from datetime import datetime
+
+# 리뷰 수집 라운드별 기록 (JSONL, 한 줄 = 한 라운드)
+# 어느 가게가 왜 오래 걸리는지 확인용: 펼치기/파싱/대기 시간, WebDriver 호출 수, 페이지 높이 등
+
+SECTIONS = ("expand", "parse", "wait") # 펼쳐서 더보기 클릭 / 블록 파싱 / 스크롤 후 대기(sleep 포함)
+
+_write_lock = threading.Lock() # 여러 워커가 같은 파일에 기록
+
+# driver.execute 를 감싸 WebDriver 명령(HTTP 왕복) 수 세기
+# WebElement 메서드도 결국 driver.execute 를 거치므로 모두 포함됨
+def install_call_counter(driver):
+    if getattr(driver, "_call_count", None) is not None:
+        return
+    driver._call_count = 0
+    orig = driver.execute
+
+    def execute(*args, **kwargs):
+        driver._call_count += 1
+        return orig(*args, **kwargs)
+
+    driver.execute = execute
+
+class CrawlTelemetry:
+    def __init__(self, path, store, driver):
+        self.path, self.store, self.driver = path, store, driver
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        install_call_counter(driver)
+        self._round = None
+        self.totals = defaultdict(float) # 가게 전체 누적 (요약용)
+        self.rounds = self.idle_rounds = 0
+        self.t_start = time.time()
+
+    @contextmanager
+    def section(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._round is not None:
+                self._round["times"][name] += time.perf_counter() - t0
+
+    # 새 라운드 시작 (이전 라운드는 기록하고 닫음)
+    def start_round(self, round_i):
+        self.finish_round()
+        self._round = {
+            "round": round_i, "t0": time.perf_counter(), "calls0": self.driver._call_count,
+            "times": defaultdict(float), "fields": {},
+        }
+
+    # 이번 라운드 값 기록 (blocks, new_rows, idle_rounds, total_rows ...)
+    def note(self, **fields):
+        if self._round is not None:
+            self._round["fields"].update(fields)
+
+    def finish_round(self):
+        r, self._round = self._round, None
+        if r is None:
+            return
+        elapsed = time.perf_counter() - r["t0"]
+        calls = self.driver._call_count - r["calls0"]
+        try:
+            scroll_height = self.driver.execute_script("return document.body.scrollHeight;")
+        except Exception:
+            scroll_height = None
+
+        rec = {
+            "ts": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "store": self.store,
+            "round": r["round"],
+            **r["fields"],
+            "elapsed_s": round(elapsed, 4),
+            **{f"{k}_s": round(r["times"][k], 4) for k in SECTIONS},
+            "webdriver_calls": calls,
+            "scroll_height": scroll_height,
+        }
+        self.rounds += 1
+        self.totals["elapsed_s"] += elapsed
+        self.totals["webdriver_calls"] += calls
+        for k in SECTIONS:
+            self.totals[f"{k}_s"] += r["times"][k]
+        if not r["fields"].get("new_rows"):
+            self.idle_rounds += 1
+            self.totals["idle_s"] += elapsed
+
+        with _write_lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    # 가게 1곳 요약 (rows: 최종 수집 건수)
+    def summary(self, rows):
+        self.finish_round()
+        wall = time.time() - self.t_start
+        loop = self.totals["elapsed_s"]
+        other = max(0.0, loop - sum(self.totals[f"{k}_s"] for k in SECTIONS))
+        return {
+            "store": self.store, "rows": rows, "rounds": self.rounds, "wall_s": round(wall, 1),
+            "rows_per_s": round(rows / wall, 2) if wall else 0.0,
+            "idle_rounds": self.idle_rounds, "idle_s": round(self.totals["idle_s"], 1),
+            **{f"{k}_s": round(self.totals[f"{k}_s"], 1) for k in SECTIONS},
+            "other_s": round(other, 1),
+            "webdriver_calls": int(self.totals["webdriver_calls"]),
+        }
+
+# 텔레메트리를 끈 경우 (collect_reviews_full 기본값)
+class NullTelemetry:
+    def section(self, name):
+        return nullcontext()
+
+    def start_round(self, round_i):
+        pass
+
+    def note(self, **fields):
+        pass
+
+    def finish_round(self):
+        pass
+
+NULL_TELEMETRY = NullTelemetry()
+
+def print_summary(s):
+    loop = s["expand_s"] + s["parse_s"] + s["wait_s"] + s["other_s"]
+    pct = lambda v: f"{v / loop * 100:.0f}%" if loop else "-"
+    print(f"  [{s['store']}] {s['rows']}건 / {s['wall_s']}초 ({s['rows_per_s']}건/초), 라운드 {s['rounds']}회"
+          f" (idle {s['idle_rounds']}회, {s['idle_s']}초 낭비)")
+    print(f"    펼치기 {s['expand_s']}초({pct(s['expand_s'])}) | 파싱 {s['parse_s']}초({pct(s['parse_s'])})"
+          f" | 대기 {s['wait_s']}초({pct(s['wait_s'])}) | 기타 {s['other_s']}초({pct(s['other_s'])})"
+          f" | WebDriver 호출 {s['webdriver_calls']}회")
+
+# JSONL 파일 → 가게별 요약 리포트
+def summarize_file(path):
+    per_store = defaultdict(lambda: defaultdict(float))
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            st = per_store[rec["store"]]
+            st["rounds"] += 1
+            st["elapsed_s"] += rec.get("elapsed_s", 0)
+            st["webdriver_calls"] += rec.get("webdriver_calls", 0)
+            st["rows"] = max(st["rows"], rec.get("total_rows", 0))
+            for k in SECTIONS:
+                st[f"{k}_s"] += rec.get(f"{k}_s", 0)
+            if not rec.get("new_rows"):
+                st["idle_rounds"] += 1
+                st["idle_s"] += rec.get("elapsed_s", 0)
+
+    out = []
+    for store, st in per_store.items():
+        loop = st["elapsed_s"]
+        s = {
+            "store": store, "rows": int(st["rows"]), "rounds": int(st["rounds"]), "wall_s": round(loop, 1),
+            "rows_per_s": round(st["rows"] / loop, 2) if loop else 0.0,
+            "idle_rounds": int(st["idle_rounds"]), "idle_s": round(st["idle_s"], 1),
+            **{f"{k}_s": round(st[f"{k}_s"], 1) for k in SECTIONS},
+            "other_s": round(max(0.0, loop - sum(st[f"{k}_s"] for k in SECTIONS)), 1),
+            "webdriver_calls": int(st["webdriver_calls"]),
+        }
+        print_summary(s)
+        out.append(s)
+    return out
+
+if __name__ == "__main__":
+    import sys
+    for p in sys.argv[1:]:
+        print(p)
+        summarize_file(p)